@@ -0,0 +1,252 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for 'zhmc nic' commands.
+"""
+
+
+import json
+
+import pytest
+import zhmcclient
+from zhmcclient_mock import FakedSession
+
+from .utils import call_zhmc_inline, assert_rc
+
+
+def faked_dpm_session():
+    """
+    Return a faked session with a CPC in DPM mode that has the OSA adapters
+    OSA1 and OSA2 with a virtual switch each, and a partition with a NIC
+    backed by the virtual switch of OSA1.
+    """
+    faked_session = FakedSession('fake-host', 'hmc1', '2.16.0', '4.10')
+    faked_session.hmc.add_resources({
+        'consoles': [{'properties': {'name': 'hmc1'}}],
+        'cpcs': [{
+            'properties': {
+                'object-id': 'cpc1',
+                'name': 'CPC1',
+                'dpm-enabled': True,
+            },
+            'adapters': [
+                {
+                    'properties': {
+                        'object-id': f'osa{i}',
+                        'name': f'OSA{i}',
+                        'type': 'osd',
+                        'adapter-family': 'osa',
+                    },
+                    'ports': [{
+                        'properties': {
+                            'element-id': 'port0',
+                            'name': 'Port 0',
+                            'index': 0,
+                        },
+                    }],
+                } for i in range(1, 3)
+            ],
+            'virtual_switches': [
+                {
+                    'properties': {
+                        'object-id': f'vswitch{i}',
+                        'name': f'VSWITCH{i}',
+                        'backing-adapter-uri': f'/api/adapters/osa{i}',
+                        'port': 0,
+                    },
+                } for i in range(1, 3)
+            ],
+            'partitions': [{
+                'properties': {
+                    'object-id': 'part1',
+                    'name': 'PART1',
+                },
+                'nics': [{
+                    'properties': {
+                        'element-id': 'nic1',
+                        'name': 'NIC1',
+                        'type': 'osd',
+                        'virtual-switch-uri':
+                            '/api/virtual-switches/vswitch1',
+                    },
+                }],
+            }],
+        }],
+    })
+    return faked_session
+
+
+@pytest.mark.parametrize(
+    "vlan_id, exp_rc, exp_vlan_id", [
+        ('5', 0, 5),
+        ('-5', 0, -5),
+        ('none', 0, None),
+        ('--5', 1, None),
+        ('²', 1, None),  # superscript two, a digit that int() rejects
+        ('5a', 1, None),
+    ]
+)
+def test_nic_update_vlan_id(vlan_id, exp_rc, exp_vlan_id):
+    """Test 'zhmc nic update' with the --vlan-id option"""
+
+    faked_session = faked_dpm_session()
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(
+        ['nic', 'update', 'CPC1', 'PART1', 'NIC1', f'--vlan-id={vlan_id}'],
+        faked_session=faked_session)
+
+    assert_rc(exp_rc, rc, stdout, stderr)
+    if exp_rc == 0:
+        faked_nic = faked_session.hmc.cpcs.lookup_by_oid('cpc1'). \
+            partitions.lookup_by_oid('part1').nics.lookup_by_oid('nic1')
+        assert faked_nic.properties['vlan-id'] == exp_vlan_id
+    else:
+        # Log output of earlier inline invocations may precede the error
+        assert stderr.splitlines()[-1] == \
+            f"Error: Invalid value for '--vlan-id': {vlan_id} is not a " \
+            "valid integer", \
+            f"stderr={stderr!r}"
+
+
+@pytest.mark.parametrize(
+    "port, exp_rc, exp_stderr", [
+        ('0', 0, None),  # port index
+        ('Port 0', 0, None),  # port name
+        ('1', 1, "Error: Could not find port with name or index '1' on "
+         "adapter 'OSA1' in CPC 'CPC1'."),
+        ('²', 1, "Error: Could not find port with name '²' on "
+         "adapter 'OSA1' in CPC 'CPC1'."),
+    ]
+)
+def test_nic_update_port(port, exp_rc, exp_stderr):
+    """Test 'zhmc nic update' with the --adapter and --port options"""
+
+    faked_session = faked_dpm_session()
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(
+        ['nic', 'update', 'CPC1', 'PART1', 'NIC1', '--adapter', 'OSA1',
+         '--port', port],
+        faked_session=faked_session)
+
+    assert_rc(exp_rc, rc, stdout, stderr)
+    if exp_stderr:
+        # Log output of earlier inline invocations may precede the error
+        assert stderr.splitlines()[-1] == exp_stderr, \
+            f"stderr={stderr!r}"
+
+
+@pytest.mark.parametrize(
+    "properties, exp_props, exp_pulled", [
+        (['type'],
+         {'type': 'osd'},
+         ['type']),
+        (['parent-name'],
+         {'parent-name': 'PART1'},
+         []),
+        (['network-adapter-name', 'network-adapter-port-index'],
+         {'network-adapter-name': 'OSA1', 'network-adapter-port-index': 0},
+         ['virtual-switch-uri', 'network-adapter-port-uri']),
+        (['type', 'virtual-switch-name', 'parent-name'],
+         {'type': 'osd', 'virtual-switch-name': 'VSWITCH1',
+          'parent-name': 'PART1'},
+         ['type', 'virtual-switch-uri', 'network-adapter-port-uri']),
+    ]
+)
+def test_nic_show_property(monkeypatch, properties, exp_props, exp_pulled):
+    """Test 'zhmc nic show' with the --property option"""
+
+    faked_session = faked_dpm_session()
+    pulled = []
+    full_pulls = []
+
+    def pull_properties(nic, properties):
+        # Behave like an HMC that supports the 'properties' query parameter
+        # for NICs and returns only the properties the NIC has
+        if isinstance(properties, str):
+            properties = [properties]
+        pulled.append(list(properties))
+        props = nic.manager.session.get(nic.uri)
+        nic.update_properties_local(
+            {k: v for k, v in props.items() if k in properties})
+
+    org_pull_full_properties = zhmcclient.Nic.pull_full_properties
+
+    def pull_full_properties(nic):
+        full_pulls.append(nic.uri)
+        org_pull_full_properties(nic)
+
+    monkeypatch.setattr(zhmcclient.Nic, 'pull_properties', pull_properties)
+    monkeypatch.setattr(
+        zhmcclient.Nic, 'pull_full_properties', pull_full_properties)
+
+    args = ['-o', 'json', 'nic', 'show', 'CPC1', 'PART1', 'NIC1']
+    for name in properties:
+        args.extend(['--property', name])
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(args, faked_session=faked_session)
+
+    assert_rc(0, rc, stdout, stderr)
+    assert json.loads(stdout) == exp_props
+    # Finding the NIC by name lists the NICs with their full properties
+    assert pulled == [exp_pulled]
+    assert full_pulls == ['/api/partitions/part1/nics/nic1']
+
+
+@pytest.mark.parametrize(
+    "options, exp_updates, exp_stdout", [
+        (['--virtual-switch', 'VSWITCH1'],
+         [],
+         "NIC 'NIC1' is already backed by the specified virtual switch; "
+         "nothing to update.\n"),
+        (['--adapter', 'OSA1', '--port', '0'],
+         [],
+         "NIC 'NIC1' is already backed by the specified virtual switch; "
+         "nothing to update.\n"),
+        (['--adapter', 'OSA1', '--port', '0', '--description', 'new'],
+         [{'description': 'new'}],
+         "NIC 'NIC1' has been updated.\n"),
+        (['--virtual-switch', 'VSWITCH2'],
+         [{'virtual-switch-uri': '/api/virtual-switches/vswitch2'}],
+         "NIC 'NIC1' has been updated.\n"),
+        (['--adapter', 'OSA2', '--port', 'Port 0'],
+         [{'virtual-switch-uri': '/api/virtual-switches/vswitch2'}],
+         "NIC 'NIC1' has been updated.\n"),
+    ]
+)
+def test_nic_update_backing(monkeypatch, options, exp_updates, exp_stdout):
+    """Test 'zhmc nic update' with an unchanged and a changed backing"""
+
+    faked_session = faked_dpm_session()
+    updates = []
+
+    def update_properties(nic, properties):
+        # pylint: disable=unused-argument
+        # The faked HMC does not allow updating the backing of a NIC
+        updates.append(dict(properties))
+
+    monkeypatch.setattr(
+        zhmcclient.Nic, 'update_properties', update_properties)
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(
+        ['nic', 'update', 'CPC1', 'PART1', 'NIC1'] + options,
+        faked_session=faked_session)
+
+    assert_rc(0, rc, stdout, stderr)
+    assert stdout == exp_stdout
+    assert updates == exp_updates
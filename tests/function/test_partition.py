@@ -0,0 +1,235 @@
+# Copyright 2026 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for 'zhmc partition' commands.
+"""
+
+
+import pytest
+import zhmcclient
+from zhmcclient_mock import FakedSession
+
+from .utils import call_zhmc_inline, assert_rc
+
+
+def faked_dpm_session():
+    """
+    Return a faked session with a CPC in DPM mode that has the partitions
+    PART1, PART2 and PART3.
+    """
+    faked_session = FakedSession('fake-host', 'hmc1', '2.16.0', '4.10')
+    faked_session.hmc.add_resources({
+        'consoles': [{'properties': {'name': 'hmc1'}}],
+        'cpcs': [{
+            'properties': {
+                'object-id': 'cpc1',
+                'name': 'CPC1',
+                'dpm-enabled': True,
+            },
+            'partitions': [
+                {'properties': {'object-id': f'part{i}', 'name': f'PART{i}'}}
+                for i in range(1, 4)
+            ],
+        }],
+    })
+    return faked_session
+
+
+@pytest.mark.parametrize(
+    "action, exp_statuses", [
+        ('start', ['active', 'degraded']),
+        ('stop', ['stopped']),
+    ]
+)
+@pytest.mark.parametrize(
+    "partitions, submit_errors, job_errors, status_errors, exp_rc, "
+    "exp_submitted, exp_status_waits, exp_stdout, exp_stderr", [
+        (['PART1', 'PART2'], [], [], [],
+         0, ['PART1', 'PART2'], ['PART1', 'PART2'],
+         "Partition 'PART1' has been {p}.\n"
+         "Partition 'PART2' has been {p}.\n",
+         None),
+        (['PART1', 'PART2', 'PART1'], [], [], [],
+         0, ['PART1', 'PART2'], ['PART1', 'PART2'],
+         "Partition 'PART1' has been {p}.\n"
+         "Partition 'PART2' has been {p}.\n",
+         None),
+        (['PART1', 'PART2', 'PART3'], ['PART1'], ['PART3'], [],
+         1, ['PART2', 'PART3'], ['PART2'],
+         "Partition 'PART2' has been {p}.\n",
+         "Error: Failed to {a} 2 of 3 partitions: "
+         "Partition 'PART1': 409,1: submit failed [None None]; "
+         "Partition 'PART3': 409,1: job failed [None None]"),
+        (['PART1', 'PART2'], [], [], ['PART2'],
+         1, ['PART1', 'PART2'], ['PART1', 'PART2'],
+         "Partition 'PART1' has been {p}.\n",
+         "Error: Failed to {a} 1 of 2 partitions: "
+         "Partition 'PART2': status timeout"),
+    ]
+)
+def test_partition_start_stop_many(
+        monkeypatch, action, exp_statuses, partitions, submit_errors,
+        job_errors, status_errors, exp_rc, exp_submitted, exp_status_waits,
+        exp_stdout, exp_stderr):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    # pylint: disable=too-many-locals
+    """Test 'zhmc partition start-many' and 'zhmc partition stop-many'"""
+
+    faked_session = faked_dpm_session()
+    submitted = []
+    status_waits = []
+
+    def operation(partition, wait_for_completion=True,
+                  operation_timeout=None, status_timeout=None):
+        # pylint: disable=unused-argument
+        if partition.name in submit_errors:
+            raise zhmcclient.HTTPError(
+                {'http-status': 409, 'reason': 1,
+                 'message': 'submit failed'})
+        submitted.append(partition.name)
+        return zhmcclient.Job(
+            partition.manager.session, f'/api/jobs/{partition.name}',
+            'POST', f'{partition.uri}/operations/{action}')
+
+    def wait_for_completion(job, operation_timeout=None):
+        # pylint: disable=unused-argument
+        if job.uri.split('/')[-1] in job_errors:
+            raise zhmcclient.HTTPError(
+                {'http-status': 409, 'reason': 1, 'message': 'job failed'})
+        return {}
+
+    def wait_for_status(partition, status, status_timeout=None):
+        # pylint: disable=unused-argument
+        status_waits.append(partition.name)
+        assert status == exp_statuses
+        if partition.name in status_errors:
+            raise zhmcclient.StatusTimeout(
+                'status timeout', 'starting', status, 60)
+
+    monkeypatch.setattr(zhmcclient.Partition, action, operation)
+    monkeypatch.setattr(
+        zhmcclient.Job, 'wait_for_completion', wait_for_completion)
+    monkeypatch.setattr(
+        zhmcclient.Partition, 'wait_for_status', wait_for_status)
+
+    args = ['partition', f'{action}-many', 'CPC1']
+    for name in partitions:
+        args.extend(['--partition', name])
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(args, faked_session=faked_session)
+
+    assert_rc(exp_rc, rc, stdout, stderr)
+    assert submitted == exp_submitted
+    assert status_waits == exp_status_waits
+    past_action = 'started' if action == 'start' else 'stopped'
+    assert stdout == exp_stdout.format(p=past_action)
+    if exp_stderr:
+        # Log output of earlier inline invocations may precede the error
+        assert stderr.splitlines()[-1] == exp_stderr.format(a=action), \
+            f"stderr={stderr!r}"
+
+
+def faked_partition_props(faked_session, name):
+    """
+    Return the properties of the faked partition with the specified name.
+    """
+    faked_cpc = faked_session.hmc.cpcs.lookup_by_oid('cpc1')
+    for faked_partition in faked_cpc.partitions.list():
+        if faked_partition.properties['name'] == name:
+            return faked_partition.properties
+    raise KeyError(name)
+
+
+@pytest.mark.parametrize(
+    "command_args, name", [
+        (['partition', 'create', 'CPC1', '--name', 'NEW'], 'NEW'),
+        (['partition', 'update', 'CPC1', 'PART1'], 'PART1'),
+    ]
+)
+@pytest.mark.parametrize(
+    "partition_id, exp_rc, exp_props", [
+        ('7F', 0, {'partition-id': '7F', 'autogenerate-partition-id': False}),
+        ('7f', 0, {'partition-id': '7F', 'autogenerate-partition-id': False}),
+        ('a', 0, {'partition-id': '0A', 'autogenerate-partition-id': False}),
+        ('auto', 0, {'autogenerate-partition-id': True}),
+        ('80', 1, None),
+        ('0x1F', 1, None),
+        ('zz', 1, None),
+        ('', 1, None),
+    ]
+)
+def test_partition_partition_id(
+        command_args, name, partition_id, exp_rc, exp_props):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Test 'zhmc partition create/update' with the --partition-id option"""
+
+    faked_session = faked_dpm_session()
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(
+        command_args + ['--partition-id', partition_id],
+        faked_session=faked_session)
+
+    assert_rc(exp_rc, rc, stdout, stderr)
+    if exp_rc == 0:
+        props = faked_partition_props(faked_session, name)
+        for pname, exp_value in exp_props.items():
+            assert props[pname] == exp_value, f"property {pname!r}"
+    else:
+        # Log output of earlier inline invocations may precede the error
+        assert stderr.splitlines()[-1] == \
+            f"Error: Invalid value specified for --partition-id option: " \
+            f"{partition_id}. Must be a hex number in the range 0 - 7F, " \
+            "or 'auto'.", \
+            f"stderr={stderr!r}"
+
+
+@pytest.mark.parametrize(
+    "command_args, name", [
+        (['partition', 'create', 'CPC1', '--name', 'NEW'], 'NEW'),
+        (['partition', 'update', 'CPC1', 'PART1'], 'PART1'),
+    ]
+)
+@pytest.mark.parametrize(
+    "gateway_args, exp_props", [
+        (['--ssc-ipv4-gateway', '10.11.12.1'],
+         {'ssc-ipv4-gateway': '10.11.12.1'}),
+        (['--ssc-ipv6-gateway', 'fd00::1'],
+         {'ssc-ipv6-gateway': 'fd00::1'}),
+        (['--ssc-ipv4-gateway', '10.11.12.1', '--ssc-ipv6-gateway', 'fd00::1'],
+         {'ssc-ipv4-gateway': '10.11.12.1', 'ssc-ipv6-gateway': 'fd00::1'}),
+        (['--ssc-ipv4-gateway', '', '--ssc-ipv6-gateway', ''],
+         {'ssc-ipv4-gateway': None, 'ssc-ipv6-gateway': None}),
+    ]
+)
+def test_partition_ssc_gateway(command_args, name, gateway_args, exp_props):
+    """Test 'zhmc partition create/update' with the SSC gateway options"""
+
+    faked_session = faked_dpm_session()
+    faked_cpc = faked_session.hmc.cpcs.lookup_by_oid('cpc1')
+    faked_cpc.partitions.lookup_by_oid('part1').update({
+        'ssc-ipv4-gateway': '10.0.0.1',
+        'ssc-ipv6-gateway': 'fd00::ff',
+    })
+
+    # Invoke the command to be tested
+    rc, stdout, stderr = call_zhmc_inline(
+        command_args + gateway_args, faked_session=faked_session)
+
+    assert_rc(0, rc, stdout, stderr)
+    props = faked_partition_props(faked_session, name)
+    for pname, exp_value in exp_props.items():
+        assert props[pname] == exp_value, f"property {pname!r}"
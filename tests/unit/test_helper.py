@@ -21,11 +21,13 @@ import re
 import pytest
 import click
 
+import zhmcclient
 from zhmcclient_mock import FakedSession
 
 from zhmccli._helper import CmdContext, parse_yaml_flow_style, \
     parse_ec_levels, parse_adapter_names, parse_crypto_domains, \
-    domains_to_domain_config, domain_config_to_props_list
+    domains_to_domain_config, domain_config_to_props_list, ConstantAdditions, \
+    concurrent_map, storage_management_feature
 
 
 # Test cases for parse_yaml_flow_style()
@@ -742,3 +744,154 @@ def test_domain_config_to_props_list(
             adapters, 'adapter', domain_configs)
 
         assert props_list == exp_props_list
+
+
+# Test cases for ConstantAdditions
+TESTCASES_CONSTANT_ADDITIONS = [
+    # value, keys
+    (
+        'cpc1',
+        ['/api/nics/1', '/api/nics/2']
+    ),
+    (
+        None,
+        ['/api/nics/1']
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "value, keys",
+    TESTCASES_CONSTANT_ADDITIONS)
+def test_constant_additions(value, keys):
+    """
+    Test function for ConstantAdditions.
+    """
+
+    # The code to be tested
+    additions = ConstantAdditions(value)
+
+    for key in keys:
+        assert additions[key] == value
+
+
+def test_cmd_context_lookup_cache():
+    """
+    Test function for CmdContext.lookup_cache().
+    """
+
+    cmd_ctx = CmdContext(
+        host='host', userid='host', password='password', no_verify=True,
+        ca_certs=None, output_format='table', transpose=False,
+        error_format='msg', timestats=False, session_id=None,
+        get_password=None, pdb=False)  # nosec: B106
+
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    client1 = zhmcclient.Client(session)
+    client2 = zhmcclient.Client(session)
+
+    # The code to be tested
+    cache1 = cmd_ctx.lookup_cache(client1)
+
+    assert cache1 == {}
+    cache1['key'] = 'value'
+
+    # The code to be tested: Same client returns the same cache
+    cache1b = cmd_ctx.lookup_cache(client1)
+
+    assert cache1b is cache1
+    assert cache1b == {'key': 'value'}
+
+    # The code to be tested: Different client returns a new cache
+    cache2 = cmd_ctx.lookup_cache(client2)
+
+    assert cache2 == {}
+
+
+@pytest.mark.parametrize(
+    "num_partitions",
+    [0, 1, 20])
+def test_concurrent_map(num_partitions):
+    """
+    Test function for concurrent_map().
+    """
+
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    session.hmc.cpcs.add({'object-id': 'cpc1', 'name': 'CPC1',
+                          'dpm-enabled': True})
+    faked_cpc = session.hmc.cpcs.lookup_by_oid('cpc1')
+    for i in range(num_partitions):
+        faked_cpc.partitions.add({'object-id': f'part{i}',
+                                  'name': f'PART{i}',
+                                  'description': f'Partition {i}'})
+    client = zhmcclient.Client(session)
+    cpc = client.cpcs.find(name='CPC1')
+    partitions = cpc.partitions.list()
+
+    def pull(partition):
+        partition.pull_full_properties()
+        return partition.properties['description']
+
+    # The function to be tested
+    result = concurrent_map(pull, partitions)
+
+    assert result == [p.properties['description'] for p in partitions]
+    assert len(partitions) == num_partitions
+    for partition in partitions:
+        assert partition.full_properties
+        i = int(partition.name[4:])
+        assert partition.properties['description'] == f'Partition {i}'
+
+
+@pytest.mark.parametrize(
+    "items",
+    [[3], list(range(20))])
+def test_concurrent_map_error(items):
+    """
+    Test function for concurrent_map() when the function raises.
+    """
+
+    def func(item):
+        if item % 10 == 3:
+            raise ValueError(f"item {item}")
+        return item
+
+    with pytest.raises(ValueError) as exc_info:
+
+        # The function to be tested
+        concurrent_map(func, items)
+
+    assert str(exc_info.value) == "item 3"
+
+
+@pytest.mark.parametrize(
+    "features, exp_result",
+    [
+        (None, False),
+        ([], False),
+        ([{'name': 'dpm-storage-management', 'state': False}], False),
+        ([{'name': 'dpm-storage-management', 'state': True}], True),
+    ])
+def test_storage_management_feature(features, exp_result):
+    """
+    Test function for storage_management_feature().
+    """
+
+    session = FakedSession('fake-host', 'fake-hmc', '2.16.0', '4.10')
+    session.hmc.cpcs.add({'object-id': 'cpc1', 'name': 'CPC1',
+                          'dpm-enabled': True})
+    faked_cpc = session.hmc.cpcs.lookup_by_oid('cpc1')
+    part_props = {'object-id': 'part1', 'name': 'PART1'}
+    if features is not None:
+        part_props['available-features-list'] = features
+    faked_cpc.partitions.add(part_props)
+    client = zhmcclient.Client(session)
+    cpc = client.cpcs.find(name='CPC1')
+    partition = cpc.partitions.find(name='PART1')
+
+    # The function to be tested
+    result = storage_management_feature(partition)
+
+    assert result is exp_result
+    if features is not None:
+        assert not partition.full_properties
@@ -59,7 +59,15 @@ STORAGE_TYPE_OPTIONS = sorted(list(STORAGE_TYPE_PROPERTIES.keys()))
 def find_adapter(cmd_ctx, client, cpc_name, adapter_name):
     """
     Find an adapter by name and return its resource object.
+
+    The result is cached for the scope of the command, so that repeated
+    lookups of the same adapter do not cause additional HMC requests.
     """
+    cache = cmd_ctx.lookup_cache(client)
+    cache_key = ('adapter', cpc_name, adapter_name)
+    if cache_key in cache:
+        return cache[cache_key]
+
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     # The CPC must be in DPM mode. We don't check that because it would
@@ -68,6 +76,8 @@ def find_adapter(cmd_ctx, client, cpc_name, adapter_name):
         adapter = cpc.adapters.find(name=adapter_name)
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
+
+    cache[cache_key] = adapter
     return adapter
 
 
@@ -29,12 +29,22 @@ from ._helper import print_properties, print_resources, abort_if_false, \
 def find_certificate(cmd_ctx, client, cert_name):
     """
     Find a certificate by name and return its resource object.
+
+    The result is cached for the scope of the command, so that repeated
+    lookups of the same certificate do not cause additional HMC requests.
     """
+    cache = cmd_ctx.lookup_cache(client)
+    cache_key = ('certificate', cert_name)
+    if cache_key in cache:
+        return cache[cache_key]
+
     console = client.consoles.console
     try:
         cert = console.certificates.find(name=cert_name)
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
+
+    cache[cache_key] = cert
     return cert
 
 
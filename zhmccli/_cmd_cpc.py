@@ -160,11 +160,21 @@ quotes. The characters in the hexadecimal string may be in upper or lower case.
 def find_cpc(cmd_ctx, client, cpc_name):
     """
     Find a CPC by name and return its resource object.
+
+    The result is cached for the scope of the command, so that repeated
+    lookups of the same CPC do not cause additional HMC requests.
     """
+    cache = cmd_ctx.lookup_cache(client)
+    cache_key = ('cpc', cpc_name)
+    if cache_key in cache:
+        return cache[cache_key]
+
     try:
         cpc = client.cpcs.find(name=cpc_name)
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
+
+    cache[cache_key] = cpc
     return cpc
 
 
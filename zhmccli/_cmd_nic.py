@@ -17,13 +17,15 @@ Commands for NICs.
 """
 
 
+import re
+
 import click
 
 import zhmcclient
 from .zhmccli import cli
 from ._helper import print_properties, print_resources, abort_if_false, \
     options_to_properties, original_options, COMMAND_OPTIONS_METAVAR, \
-    click_exception, add_options, LIST_OPTIONS
+    click_exception, add_options, LIST_OPTIONS, ConstantAdditions
 from ._cmd_partition import find_partition
 from ._cmd_cpc import find_cpc
 
@@ -32,6 +34,61 @@ from ._cmd_cpc import find_cpc
 SSC_IP_ADDRESS_TYPES = ['ipv4', 'ipv6', 'linklocal', 'dhcp']
 VLAN_TYPES = ['enforced', 'none']
 
+# Pattern for valid --vlan-id integer values (decimal, ASCII digits only)
+VLAN_ID_PATTERN = re.compile(r'-?[0-9]+')
+
+# Click options for the SSC and VLAN related properties, used for the
+# 'nic create' and 'nic update' commands
+NIC_SSC_VLAN_OPTIONS = [
+    click.option('--ssc-management-nic', type=bool, required=False,
+                 help='Indicates that this NIC should be used as a management '
+                 'NIC for Secure Service Container to access the web '
+                 'interface. Only applicable to NICs of SSC partitions. '
+                 'Default when creating: False'),
+    click.option('--ssc-ip-address-type',
+                 type=click.Choice(SSC_IP_ADDRESS_TYPES), required=False,
+                 help='Secure Service Container IP address type. '
+                 'Only applicable to NICs of SSC partitions, and required '
+                 'when creating them.'),
+    click.option('--ssc-ip-address', type=str, required=False,
+                 help='IP Address of the SSC management web interface. '
+                 'Only applicable to NICs of SSC partitions, and required '
+                 'when creating them with ssc-ip-address-type ipv4 or ipv6.'),
+    click.option('--ssc-mask-prefix', type=str, required=False,
+                 help='Network Mask of the SSC management NIC. '
+                 'Only applicable to NICs of SSC partitions, and required '
+                 'when creating them with ssc-ip-address-type ipv4 or ipv6.'),
+    click.option('--vlan-id', metavar='[INT|none]', type=str, required=False,
+                 help='VLAN ID of the NIC, or "none" for setting no VLAN ID. '
+                 'On z14 or later CPCs, specifying a VLAN ID requires using '
+                 'the --vlan-type option. '
+                 'Only applicable to management NICs of SSC partitions, and '
+                 'to OSA and Hipersocket NICs of non-SSC partitions. '
+                 'Default when creating: No VLAN ID'),
+    click.option('--vlan-type', required=False, type=click.Choice(VLAN_TYPES),
+                 help='VLAN type of the NIC, or "none" for setting no VLAN '
+                 'type. Only supported on z14 or later CPCs, and required if '
+                 'specifying a VLAN ID with the --vlan-id option. '
+                 'Default when creating: No VLAN type'),
+]
+
+# Name mapping of the 'nic create' and 'nic update' options to NIC properties,
+# for options_to_properties()
+NIC_NAME_MAP = {
+    # The following options are handled in backing_uri():
+    'adapter': None,
+    'port': None,
+    'virtual-switch': None,
+}
+
+# Artificial properties added by 'nic show' for the backing adapter and port
+NIC_BACKING_PROPS = [
+    'virtual-switch-name',
+    'network-adapter-name',
+    'network-adapter-port-name',
+    'network-adapter-port-index',
+]
+
 
 def find_nic(cmd_ctx, client, cpc_name, partition_name, nic_name):
     """
@@ -79,8 +136,13 @@ def nic_list(cmd_ctx, cpc, partition, **options):
 @click.argument('CPC', type=str, metavar='CPC')
 @click.argument('PARTITION', type=str, metavar='PARTITION')
 @click.argument('NIC', type=str, metavar='NIC')
+@click.option('--property', type=str, required=False, multiple=True,
+              metavar='PROPERTY',
+              help='A property to be shown. Only the specified properties are '
+              'retrieved from the HMC. Can be specified multiple times. '
+              'Default: Show all properties')
 @click.pass_obj
-def nic_show(cmd_ctx, cpc, partition, nic):
+def nic_show(cmd_ctx, cpc, partition, nic, **options):
     """
     Show the details of a NIC.
 
@@ -98,7 +160,8 @@ def nic_show(cmd_ctx, cpc, partition, nic):
     general options (see 'zhmc --help') can also be specified right after the
     'zhmc' command name.
     """
-    cmd_ctx.execute_cmd(lambda: cmd_nic_show(cmd_ctx, cpc, partition, nic))
+    cmd_ctx.execute_cmd(lambda: cmd_nic_show(cmd_ctx, cpc, partition, nic,
+                                             options))
 
 
 @nic_group.command('create', options_metavar=COMMAND_OPTIONS_METAVAR)
@@ -121,36 +184,7 @@ def nic_show(cmd_ctx, cpc, partition, nic):
 @click.option('--device-number', type=str, required=False,
               help='The device number to be used for the new NIC. '
               'Default: auto-generated')
-@click.option('--ssc-management-nic', type=bool, required=False,
-              help='Indicates that this NIC should be used as a management '
-              'NIC for Secure Service Container to access the web interface. '
-              'Only applicable to NICs of SSC partitions. '
-              'Default: False')
-@click.option('--ssc-ip-address-type', type=click.Choice(SSC_IP_ADDRESS_TYPES),
-              required=False,
-              help='Secure Service Container IP address type. '
-              'Only applicable to and required for NICs of '
-              'SSC partitions.')
-@click.option('--ssc-ip-address', type=str, required=False,
-              help='IP Address of the SSC management web interface. '
-              'Only applicable to and required for NICs of SSC '
-              'partitions when ssc-ip-address-type is ipv4 or ipv6.')
-@click.option('--ssc-mask-prefix', type=str, required=False,
-              help='Network Mask of the SSC management NIC. '
-              'Only applicable to and required for NICs of SSC '
-              'partitions when ssc-ip-address-type is ipv4 or ipv6.')
-@click.option('--vlan-id', metavar='[INT|none]', type=str, required=False,
-              help='VLAN ID of the NIC, or "none" for setting no VLAN ID. '
-              'On z14 or later CPCs, specifying a VLAN ID requires using the '
-              '--vlan-type option. '
-              'Only applicable to management NICs of SSC partitions, and to '
-              'OSA and Hipersocket NICs of non-SSC partitions. '
-              'Default: No VLAN ID')
-@click.option('--vlan-type', required=False, type=click.Choice(VLAN_TYPES),
-              help='VLAN type of the NIC, or "none" for setting no VLAN type. '
-              'Only supported on z14 or later CPCs, and required if specifying '
-              'a VLAN ID with the --vlan-id option. '
-              'Default: No VLAN type')
+@add_options(NIC_SSC_VLAN_OPTIONS)
 @click.pass_obj
 def nic_create(cmd_ctx, cpc, partition, **options):
     """
@@ -189,30 +223,7 @@ def nic_create(cmd_ctx, cpc, partition, **options):
               'port backing the NIC. Use --adapter and --port instead.')
 @click.option('--device-number', type=str, required=False,
               help='The new device number to be used for the NIC.')
-@click.option('--ssc-management-nic', type=bool, required=False,
-              help='Indicates that this NIC should be used as a management '
-              'NIC for Secure Service Container to access the web interface. '
-              'Only applicable to NICs of SSC partitions. ')
-@click.option('--ssc-ip-address-type', type=click.Choice(SSC_IP_ADDRESS_TYPES),
-              required=False,
-              help='Secure Service Container IP address type. '
-              'Only applicable to NICs of SSC partitions.')
-@click.option('--ssc-ip-address', type=str, required=False,
-              help='IP Address of the SSC management web interface. '
-              'Only applicable to NICs of SSC partitions.')
-@click.option('--ssc-mask-prefix', type=str, required=False,
-              help='Network Mask of the SSC management NIC. '
-              'Only applicable to NICs of SSC partitions.')
-@click.option('--vlan-id', metavar='[INT|none]', type=str, required=False,
-              help='VLAN ID of the NIC, or "none" for setting no VLAN ID. '
-              'On z14 or later CPCs, specifying a VLAN ID requires using the '
-              '--vlan-type option. '
-              'Only applicable to management NICs of SSC partitions, and to '
-              'OSA and Hipersocket NICs of non-SSC partitions.')
-@click.option('--vlan-type', required=False, type=click.Choice(VLAN_TYPES),
-              help='VLAN type of the NIC, or "none" for setting no VLAN type. '
-              'Only supported on z14 or later CPCs, and required if specifying '
-              'a VLAN ID with the --vlan-id option.')
+@add_options(NIC_SSC_VLAN_OPTIONS)
 @click.pass_obj
 def nic_update(cmd_ctx, cpc, partition, nic, **options):
     """
@@ -264,18 +275,21 @@ def backing_uri(cmd_ctx, cpc, org_options, required=False):
       click exception for various error situations.
     """
 
-    if org_options['virtual-switch']:
+    vswitch_name = org_options['virtual-switch']
+    adapter_name = org_options['adapter']
+    port_name = org_options['port']
+
+    if vswitch_name:
         # This option is deprecated, but it is still supported for
         # backwards compatibility.
 
-        if org_options['adapter'] or org_options['port']:
+        if adapter_name or port_name:
             raise click_exception(
                 "The (deprecated) --virtual-switch option must not be "
                 "specified together with any of the --adapter or --port "
                 "options.",
                 cmd_ctx.error_format)
 
-        vswitch_name = org_options['virtual-switch']
         try:
             vswitch = cpc.virtual_switches.find(name=vswitch_name)
         except zhmcclient.NotFound:
@@ -285,29 +299,19 @@ def backing_uri(cmd_ctx, cpc, org_options, required=False):
                 cmd_ctx.error_format)
         return {'virtual-switch-uri': vswitch.uri}
 
-    if bool(org_options['adapter']) != bool(org_options['port']):
+    if bool(adapter_name) != bool(port_name):
         raise click_exception(
             "The --adapter and --port options must be specified both or none.",
             cmd_ctx.error_format)
 
-    if org_options['adapter']:
-        adapter_name = org_options['adapter']
-    else:
+    if not adapter_name:
+        # Neither --adapter nor --port has been specified
         if required:
             raise click_exception(
                 "Required --adapter option is not specified",
                 cmd_ctx.error_format)
         return None
 
-    if org_options['port']:
-        port_name = org_options['port']
-    else:
-        if required:
-            raise click_exception(
-                "Required --port option is not specified",
-                cmd_ctx.error_format)
-        return None
-
     try:
         adapter = cpc.adapters.find(name=adapter_name)
     except zhmcclient.NotFound:
@@ -316,26 +320,28 @@ def backing_uri(cmd_ctx, cpc, org_options, required=False):
             format(a=adapter_name, c=cpc.name),
             cmd_ctx.error_format)
 
-    try:
-        port = adapter.ports.find(name=port_name)
-    except zhmcclient.NotFound:
-        # Try interpreting the --port value as a port index
-        try:
-            port_index = int(port_name)
-        except ValueError:
-            raise click_exception(
-                "Could not find port with name '{p}' on "
-                "adapter '{a}' in CPC '{c}'.".
-                format(p=port_name, a=adapter_name, c=cpc.name),
-                cmd_ctx.error_format)
+    # The --port value is a port name or a port index. A numeric value is
+    # most likely an index, so that is tried first, in order to save the
+    # lookup by name in the common case.
+    if port_name.isdecimal():
+        lookups = [{'index': int(port_name)}, {'name': port_name}]
+        what = "name or index"
+    else:
+        lookups = [{'name': port_name}]
+        what = "name"
+    port = None
+    for filter_args in lookups:
         try:
-            port = adapter.ports.find(index=port_index)
+            port = adapter.ports.find(**filter_args)
+            break
         except zhmcclient.NotFound:
-            raise click_exception(
-                "Could not find port with name or index '{p}' on "
-                "adapter '{a}' in CPC '{c}'.".
-                format(p=port_name, a=adapter_name, c=cpc.name),
-                cmd_ctx.error_format)
+            continue
+    if port is None:
+        raise click_exception(
+            "Could not find port with {w} '{p}' on "
+            "adapter '{a}' in CPC '{c}'.".
+            format(w=what, p=port_name, a=adapter_name, c=cpc.name),
+            cmd_ctx.error_format)
 
     adapter_type = adapter.get_property('type')
     if adapter_type in ('roce', 'cna'):
@@ -394,14 +400,9 @@ def cmd_nic_list(cmd_ctx, cpc_name, partition_name, options):
             'element-uri',
         ])
 
-    cpc_additions = {}
-    partition_additions = {}
-    for nic in nics:
-        cpc_additions[nic.uri] = cpc_name
-        partition_additions[nic.uri] = partition_name
     additions = {
-        'cpc': cpc_additions,
-        'partition': partition_additions,
+        'cpc': ConstantAdditions(cpc_name),
+        'partition': ConstantAdditions(partition_name),
     }
 
     try:
@@ -411,14 +412,27 @@ def cmd_nic_list(cmd_ctx, cpc_name, partition_name, options):
         raise click_exception(exc, cmd_ctx.error_format)
 
 
-def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name):
+def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name, options):
     # pylint: disable=missing-function-docstring
 
     client = zhmcclient.Client(cmd_ctx.session)
     nic = find_nic(cmd_ctx, client, cpc_name, partition_name, nic_name)
 
+    show_list = list(options['property']) or None
+
     try:
-        nic.pull_full_properties()
+        if show_list:
+            # Retrieve only the requested properties from the HMC, and the
+            # backing URIs if artificial properties about the backing adapter
+            # are requested
+            pull_props = [p for p in show_list
+                          if p != 'parent-name' and p not in NIC_BACKING_PROPS]
+            if any(p in NIC_BACKING_PROPS for p in show_list):
+                pull_props.extend(['virtual-switch-uri',
+                                   'network-adapter-port-uri'])
+            nic.pull_properties(pull_props)
+        else:
+            nic.pull_full_properties()
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
 
@@ -427,12 +441,20 @@ def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name):
     # Add artificial property 'parent-name'
     properties['parent-name'] = partition_name
 
+    if show_list and not any(p in NIC_BACKING_PROPS for p in show_list):
+        # None of the artificial properties about the backing adapter are
+        # requested, so we save the HMC requests for determining them.
+        print_properties(cmd_ctx, properties, cmd_ctx.output_format,
+                         show_list)
+        return
+
+    # The backing URIs have been retrieved above. They are accessed without
+    # get_property(), which would retrieve the full properties again for a
+    # backing URI the NIC does not have.
+
     # Add artificial properties in case of a vswitch-based NIC (OSA, HS)
-    try:
-        vswitch_uri = nic.get_property('virtual-switch-uri')
-    except KeyError:
-        pass
-    else:
+    vswitch_uri = nic.properties.get('virtual-switch-uri')
+    if vswitch_uri:
         vswitch_props = client.session.get(vswitch_uri)
         properties['virtual-switch-name'] = vswitch_props['name']
 
@@ -448,11 +470,8 @@ def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name):
         properties['network-adapter-port-name'] = port.name
 
     # Add artificial properties in case of an adapter-based NIC (RoCE, CNA)
-    try:
-        port_uri = nic.get_property('network-adapter-port-uri')
-    except KeyError:
-        pass
-    else:
+    port_uri = nic.properties.get('network-adapter-port-uri')
+    if port_uri:
         port_props = client.session.get(port_uri)
         properties['network-adapter-port-name'] = port_props['name']
         properties['network-adapter-port-index'] = port_props['index']
@@ -460,7 +479,7 @@ def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name):
         adapter_props = client.session.get(port_props['parent'])
         properties['network-adapter-name'] = adapter_props['name']
 
-    print_properties(cmd_ctx, properties, cmd_ctx.output_format)
+    print_properties(cmd_ctx, properties, cmd_ctx.output_format, show_list)
 
 
 def cmd_nic_create(cmd_ctx, cpc_name, partition_name, options):
@@ -469,14 +488,8 @@ def cmd_nic_create(cmd_ctx, cpc_name, partition_name, options):
     client = zhmcclient.Client(cmd_ctx.session)
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
-    name_map = {
-        # The following options are handled in this function:
-        'adapter': None,
-        'port': None,
-        'virtual-switch': None,
-    }
     org_options = original_options(options)
-    properties = options_to_properties(org_options, name_map)
+    properties = options_to_properties(org_options, NIC_NAME_MAP)
 
     set_vlan_id_type(cmd_ctx, properties, org_options)
 
@@ -499,21 +512,34 @@ def cmd_nic_update(cmd_ctx, cpc_name, partition_name, nic_name, options):
     client = zhmcclient.Client(cmd_ctx.session)
     nic = find_nic(cmd_ctx, client, cpc_name, partition_name, nic_name)
 
-    name_map = {
-        # The following options are handled in this function:
-        'adapter': None,
-        'port': None,
-        'virtual-switch': None,
-    }
     org_options = original_options(options)
-    properties = options_to_properties(org_options, name_map)
+    properties = options_to_properties(org_options, NIC_NAME_MAP)
 
     set_vlan_id_type(cmd_ctx, properties, org_options)
 
     uri_prop = backing_uri(
         cmd_ctx, nic.manager.partition.manager.cpc, org_options)
     if uri_prop:
-        properties.update(uri_prop)
+        # Update the backing object only if it actually changes, to avoid
+        # an unnecessary "Update NIC Properties" operation. This costs one
+        # HMC request for retrieving the current backing URI of the NIC,
+        # since finding the NIC by name does not keep its properties.
+        uri_name, uri_value = list(uri_prop.items())[0]
+        try:
+            nic.pull_properties([uri_name])
+        except zhmcclient.Error as exc:
+            raise click_exception(exc, cmd_ctx.error_format)
+        if nic.prop(uri_name) != uri_value:
+            properties.update(uri_prop)
+        elif not properties:
+            cmd_ctx.spinner.stop()
+            click.echo("NIC '{n}' is already backed by the specified {o}; "
+                       "nothing to update.".
+                       format(n=nic_name,
+                              o='virtual switch'
+                              if uri_name == 'virtual-switch-uri'
+                              else 'adapter port'))
+            return
 
     if not properties:
         cmd_ctx.spinner.stop()
@@ -559,13 +585,12 @@ def set_vlan_id_type(cmd_ctx, properties, org_options):
     elif vlan_id == 'none':
         # Reset to no VLAN ID (important for update)
         properties['vlan-id'] = None
+    elif VLAN_ID_PATTERN.fullmatch(vlan_id):
+        properties['vlan-id'] = int(vlan_id)
     else:
-        try:
-            properties['vlan-id'] = int(vlan_id)
-        except ValueError:
-            raise click_exception(
-                "Invalid value for '--vlan-id': {} is not a valid integer".
-                format(vlan_id), cmd_ctx.error_format)
+        raise click_exception(
+            "Invalid value for '--vlan-id': {} is not a valid integer".
+            format(vlan_id), cmd_ctx.error_format)
 
     vlan_type = org_options['vlan-type']
     if vlan_type is None:
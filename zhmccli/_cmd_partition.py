@@ -32,7 +32,8 @@ from ._helper import print_properties, print_resources, abort_if_false, \
     add_options, LIST_OPTIONS, TABLE_FORMATS, hide_property, \
     ASYNC_TIMEOUT_OPTIONS, API_VERSION_HMC_2_14_0, parse_adapter_names, \
     parse_crypto_domains, domains_to_domain_config, \
-    domain_config_to_props_list, print_dicts, API_VERSION_HMC_2_16_0
+    domain_config_to_props_list, print_dicts, API_VERSION_HMC_2_16_0, \
+    concurrent_map
 from ._cmd_cpc import find_cpc
 from ._cmd_storagegroup import find_storagegroup
 from ._cmd_certificates import find_certificate
@@ -54,11 +55,185 @@ MAX_PROCESSING_WEIGHT = 999
 MIN_BOOT_TIMEOUT = 60
 MAX_BOOT_TIMEOUT = 600
 
+# Click parameter types of options that are used in both 'partition create'
+# and 'partition update'
+PROCESSOR_MODE_CHOICE = click.Choice(['dedicated', 'shared'])
+PROCESSING_WEIGHT_RANGE = click.IntRange(
+    MIN_PROCESSING_WEIGHT, MAX_PROCESSING_WEIGHT)
+BOOT_TIMEOUT_RANGE = click.IntRange(MIN_BOOT_TIMEOUT, MAX_BOOT_TIMEOUT)
+BOOT_MEDIA_TYPE_CHOICE = click.Choice(['usb', 'cdrom'])
+
+# Pattern for the --partition-id option value (hex number in range 0 - 7F)
+PARTITION_ID_PATTERN = re.compile(r'[0-7]?[0-9A-F]$', re.I)
+
+# Pattern for the --boot-record-location option value (CYL.HEAD.RECORD)
+BOOT_RECORD_LOCATION_PATTERN = re.compile(
+    r'([0-9A-F]+)\.([0-9A-F]+)\.([0-9A-F]+)$', re.I)
+
+# Partition properties needed by 'partition list' for calculating the IFL and
+# CP usage, in addition to the properties that are shown
+PARTITION_USAGE_PROPS = [
+    'ifl-processors',
+    'initial-ifl-processing-weight',
+    'cp-processors',
+    'initial-cp-processing-weight',
+]
+
+# CPC properties needed by 'partition list' for calculating the IFL and CP
+# usage
+CPC_PROCESSOR_COUNT_PROPS = [
+    'processor-count-ifl',
+    'processor-count-general-purpose',
+]
+
+# Properties shown by 'partition list' in addition to name and CPC, unless
+# --names-only is specified. The 'description' property is shown after these,
+# unless one of the usage options is specified.
+PARTITION_LIST_PROPS = (
+    'short-name',
+    'status',
+    'type',
+    'os-name',
+    'os-type',
+    'os-version',
+)
+
+# Names of the additional (=non-resource) values that can be shown by
+# 'partition list'
+PARTITION_LIST_ADDITIONS = (
+    'ifl-capacity',
+    'ifls',
+    'ifl-weight',
+    'cp-capacity',
+    'cps',
+    'cp-weight',
+    'processor-usage',
+    'processors-used',
+    'cpc',
+)
+
+# Help text describing the formats of a storage volume specification, as
+# used by the 'partition dump --volume' and
+# 'partition update --boot-storage-volume' options
+STORAGE_VOLUME_FORMATS_HELP = (
+    'For CPCs with the storage management feature (z14 and later): '
+    'A string of the form "SG/SV" where SG is the name of the storage group '
+    'attached to the partition and SV is the name of the storage volume in '
+    'that storage group, or of the form "UUID" where UUID is the UUID of the '
+    'storage volume on the storage array (also shown in the HMC GUI). The '
+    'storage volume may be of type FCP or FICON. '
+    'For CPCs without the storage management feature (z13 and earlier): '
+    'A string of the form "HBA/WWPN/LUN", where HBA is the name of the HBA '
+    'to be used and WWPN and LUN identify the storage array and storage '
+    'volume thereon. The storage volume must be of type FCP.')
+
+
+# The following options of 'partition create' and 'partition update' are
+# handled specifically in these commands (as opposed to be handled generically
+# in options_to_properties()):
+
+# The option for booting from a storage volume ('partition update' only).
+# For consistency, a list is used even though it is a single option.
+BOOT_STORAGE_OPTION_NAMES = (
+    'boot-storage-volume',
+)
+
+# The deprecated options for booting from an FCP storage volume
+# ('partition update' only).
+# They need to be specified together, all of them are required.
+OLD_BOOT_STORAGE_OPTION_NAMES = (
+    'boot-storage-hba',
+    'boot-storage-lun',
+    'boot-storage-wwpn',
+)
+
+# The option for booting from a PXE server ('partition update' only).
+# For consistency, a list is used even though it is a single option.
+BOOT_NETWORK_OPTION_NAMES = (
+    'boot-network-nic',
+)
+
+# The options for booting from an FTP server.
+# They need to be specified together, all of them are required.
+BOOT_FTP_OPTION_NAMES = (
+    'boot-ftp-host',
+    'boot-ftp-username',
+    'boot-ftp-password',
+    'boot-ftp-insfile',
+)
+
+# The options for booting from an HMC media file in 'partition create'.
+CREATE_BOOT_MEDIA_OPTION_NAMES = (
+    'boot-media-file',
+    'boot-media-type',
+)
+
+# The option for booting from an HMC media file in 'partition update'.
+# For consistency, a list is used even though it is a single option.
+UPDATE_BOOT_MEDIA_OPTION_NAMES = (
+    'boot-media-file',
+)
+
+# The option for booting from an HMC ISO image ('partition update' only).
+# For consistency, a list is used even though it is a single option.
+BOOT_ISO_OPTION_NAMES = (
+    'boot-iso',
+)
+
+# Specially handled options in 'partition create'
+CREATE_SPECIAL_OPTION_NAMES = (
+    'partition-id',
+    'acceptable-status',
+    'ssc-dns-servers',
+    'ssc-ipv4-gateway',
+    'ssc-ipv6-gateway',
+    'cp-absolute-capping',
+    'ifl-absolute-capping',
+)
+
+# Specially handled options in 'partition update'
+UPDATE_SPECIAL_OPTION_NAMES = CREATE_SPECIAL_OPTION_NAMES + (
+    'boot-ficon-loader-mode',
+    'boot-record-lba',
+    'boot-record-location',
+    'boot-configuration',
+)
+
+# Name mapping of the 'partition create' options to partition properties,
+# for options_to_properties()
+PARTITION_CREATE_NAME_MAP = {
+    opt: None for opt in (
+        *BOOT_FTP_OPTION_NAMES, *CREATE_BOOT_MEDIA_OPTION_NAMES,
+        *CREATE_SPECIAL_OPTION_NAMES)
+}
+
+# Name mapping of the 'partition update' options to partition properties,
+# for options_to_properties()
+PARTITION_UPDATE_NAME_MAP = {
+    opt: None for opt in (
+        *BOOT_STORAGE_OPTION_NAMES, *OLD_BOOT_STORAGE_OPTION_NAMES,
+        *BOOT_NETWORK_OPTION_NAMES, *BOOT_FTP_OPTION_NAMES,
+        *UPDATE_BOOT_MEDIA_OPTION_NAMES, *BOOT_ISO_OPTION_NAMES,
+        *UPDATE_SPECIAL_OPTION_NAMES)
+}
+PARTITION_UPDATE_NAME_MAP.update({
+    # option name: HMC property name
+    'boot-iso-insfile': 'boot-iso-ins-file',
+})
+
 
 def find_partition(cmd_ctx, client, cpc_name, partition_name):
     """
     Find a partition by name and return its resource object.
+
+    The result is cached for the scope of the command, so that repeated
+    lookups of the same partition do not cause additional HMC requests.
     """
+    cache = cmd_ctx.lookup_cache(client)
+    cache_key = ('partition', cpc_name, partition_name)
+    if cache_key in cache:
+        return cache[cache_key]
+
     if client.version_info() >= API_VERSION_HMC_2_14_0:
         # This approach is faster than going through the CPC.
         # In addition, this approach supports users that do not have object
@@ -82,9 +257,152 @@ def find_partition(cmd_ctx, client, cpc_name, partition_name):
         except zhmcclient.Error as exc:
             raise click_exception(exc, cmd_ctx.error_format)
 
+    cache[cache_key] = partition
     return partition
 
 
+def find_adapters(cmd_ctx, client, cpc_name, adapter_names):
+    """
+    Find adapters by name and return their resource objects, in the order of
+    the names. Adapter names that are specified more than once result in
+    only one adapter.
+    """
+    adapters = {}  # key: adapter URI, value: Adapter
+    for adapter_name in adapter_names:
+        adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
+        adapters.setdefault(adapter.uri, adapter)
+    return list(adapters.values())
+
+
+def attached_storage_groups(partition, prop_names):
+    """
+    Return the storage groups that are attached to a partition, with the
+    specified properties retrieved.
+
+    Only the 'storage-group-uris' property of the partition and the specified
+    properties of the storage groups are retrieved, instead of their full set
+    of properties. The properties of the storage groups are retrieved using
+    concurrent HMC requests.
+
+    Parameters:
+
+      partition (zhmcclient.Partition): The partition.
+
+      prop_names (list of string): The names of the storage group properties
+        to be retrieved. May be empty.
+
+    Returns:
+
+      list of zhmcclient.StorageGroup: The attached storage groups.
+
+    Raises:
+
+      zhmcclient.Error: Error from the HMC.
+    """
+    if 'storage-group-uris' not in partition.properties:
+        partition.pull_properties(['storage-group-uris'])
+    stogrps = partition.list_attached_storage_groups()
+    if prop_names:
+        concurrent_map(lambda sg: sg.pull_properties(prop_names), stogrps)
+    return stogrps
+
+
+def used_and_missing_options(org_options, option_names):
+    """
+    Return the options from a group of options that have been specified and
+    those that have not been specified, in a single pass over the group.
+
+    Parameters:
+
+      org_options (dict): The options dictionary (key: original option name,
+        value: option value).
+
+      option_names (iterable of string): The original option names of the
+        group.
+
+    Returns:
+
+      tuple(used, missing): The lists of used and missing options, each as
+      option names with leading '--'.
+    """
+    used = []
+    missing = []
+    for name in option_names:
+        if org_options[name] is not None:
+            used.append('--' + name)
+        else:
+            missing.append('--' + name)
+    return used, missing
+
+
+def special_options_to_properties(cmd_ctx, org_options, properties):
+    """
+    Convert the specially handled options that are common to
+    'partition create' and 'partition update' (see
+    CREATE_SPECIAL_OPTION_NAMES) into partition properties.
+
+    Parameters:
+
+      cmd_ctx (CmdContext): Context object of the command.
+
+      org_options (dict): The options dictionary (key: original option name,
+        value: option value).
+
+      properties (dict): The partition properties. Will be updated with the
+        properties resulting from the options.
+
+    Raises:
+      click.ClickException: Invalid value of the --partition-id option.
+    """
+    if org_options['partition-id'] == "auto":
+        properties['autogenerate-partition-id'] = True
+    elif org_options['partition-id'] is not None:
+        value = org_options['partition-id']
+        if not PARTITION_ID_PATTERN.match(value):
+            raise click_exception(
+                "Invalid value specified for --partition-id option: {v}. "
+                "Must be a hex number in the range 0 - 7F, or 'auto'.".
+                format(v=value),
+                cmd_ctx.error_format)
+        properties['partition-id'] = "{:02X}".format(int(value, 16))
+        properties['autogenerate-partition-id'] = False
+
+    if org_options['acceptable-status'] is not None:
+        status_list = org_options['acceptable-status'].split(',')
+        status_list = [item for item in status_list if item]
+        properties['acceptable-status'] = status_list
+
+    if org_options['ssc-dns-servers'] == '':
+        properties['ssc-dns-servers'] = []
+    elif org_options['ssc-dns-servers'] is not None:
+        properties['ssc-dns-servers'] = \
+            org_options['ssc-dns-servers'].split(',')
+
+    if org_options['ssc-ipv4-gateway'] == '':
+        properties['ssc-ipv4-gateway'] = None
+    elif org_options['ssc-ipv4-gateway'] is not None:
+        properties['ssc-ipv4-gateway'] = org_options['ssc-ipv4-gateway']
+
+    if org_options['ssc-ipv6-gateway'] == '':
+        properties['ssc-ipv6-gateway'] = None
+    elif org_options['ssc-ipv6-gateway'] is not None:
+        properties['ssc-ipv6-gateway'] = org_options['ssc-ipv6-gateway']
+
+    if org_options['cp-absolute-capping'] == '':
+        properties['cp-absolute-processor-capping'] = False
+    elif org_options['cp-absolute-capping'] is not None:
+        properties['cp-absolute-processor-capping'] = True
+        properties['cp-absolute-processor-capping-value'] = \
+            org_options['cp-absolute-capping']
+
+    if org_options['ifl-absolute-capping'] == '':
+        properties['ifl-absolute-processor-capping'] = False
+    elif org_options['ifl-absolute-capping'] is not None:
+        properties['ifl-absolute-processor-capping'] = True
+        properties['ifl-absolute-processor-capping-value'] = \
+            org_options['ifl-absolute-capping']
+
+
 @cli.group('partition', options_metavar=COMMAND_OPTIONS_METAVAR)
 def partition_group():
     """
@@ -193,23 +511,60 @@ def partition_stop(cmd_ctx, cpc, partition, **options):
         cmd_ctx, cpc, partition, options))
 
 
+@partition_group.command('start-many', options_metavar=COMMAND_OPTIONS_METAVAR)
+@click.argument('CPC', type=str, metavar='CPC')
+@click.option('--partition', type=str, required=True, multiple=True,
+              metavar='PARTITION',
+              help='The name of a partition to be started. Can be specified '
+              'multiple times.')
+@add_options(ASYNC_TIMEOUT_OPTIONS)
+@click.pass_obj
+def partition_start_many(cmd_ctx, cpc, **options):
+    """
+    Start multiple partitions in a CPC.
+
+    The start operations for all partitions are submitted to the HMC first,
+    and then their completion is waited for. This allows the partitions to
+    be started concurrently by the HMC.
+
+    In addition to the command-specific options shown in this help text, the
+    general options (see 'zhmc --help') can also be specified right after the
+    'zhmc' command name.
+    """
+    cmd_ctx.execute_cmd(lambda: cmd_partition_start_stop_many(
+        cmd_ctx, cpc, 'start', options))
+
+
+@partition_group.command('stop-many', options_metavar=COMMAND_OPTIONS_METAVAR)
+@click.argument('CPC', type=str, metavar='CPC')
+@click.option('--partition', type=str, required=True, multiple=True,
+              metavar='PARTITION',
+              help='The name of a partition to be stopped. Can be specified '
+              'multiple times.')
+@add_options(ASYNC_TIMEOUT_OPTIONS)
+@click.pass_obj
+def partition_stop_many(cmd_ctx, cpc, **options):
+    """
+    Stop multiple partitions in a CPC.
+
+    The stop operations for all partitions are submitted to the HMC first,
+    and then their completion is waited for. This allows the partitions to
+    be stopped concurrently by the HMC.
+
+    In addition to the command-specific options shown in this help text, the
+    general options (see 'zhmc --help') can also be specified right after the
+    'zhmc' command name.
+    """
+    cmd_ctx.execute_cmd(lambda: cmd_partition_start_stop_many(
+        cmd_ctx, cpc, 'stop', options))
+
+
 @partition_group.command('dump', options_metavar=COMMAND_OPTIONS_METAVAR)
 @click.argument('CPC', type=str, metavar='CPC')
 @click.argument('PARTITION', type=str, metavar='PARTITION')
 @click.option('--volume', type=str, required=True,
-              help='The storage volume that contains the dump program. '
-              'For CPCs with the storage management feature (z14 and later): '
-              'A string of the form "SG/SV" where SG is the name '
-              'of the storage group resource attached to the partition and SV '
-              'is the name of the storage volume in that storage group, or of '
-              'the form "UUID" where UUID is the UUID of the storage volume '
-              'on the storage array (also shown in the HMC GUI). The storage '
-              'volume may be of type FCP or FICON. '
-              'For CPCs without the storage management feature (z13 and '
-              'earlier): A string of the form "HBA/WWPN/LUN", where HBA is the '
-              'name of the HBA resource in the partition and WWPN and LUN '
-              'identify the storage array and storage volume thereon. The '
-              'storage volume must be of type FCP.')
+              help='The storage volume that contains the dump '
+              'program. ' + STORAGE_VOLUME_FORMATS_HELP)
 @click.option('--lba', type=str, required=False, default='0',
               help='The logical block number of the anchor point for locating '
               'the dump program on the storage volume. Default: 0')
@@ -252,8 +607,8 @@ def partition_dump(cmd_ctx, cpc, partition, **options):
 @optgroup.option('--name', type=str, required=True,
                  help='The name of the new partition.')
 @optgroup.option('--type', type=click.Choice(PARTITION_TYPES), required=False,
-                 help='Defines the type of the partition. Default: {pd}'.
-                 format(pd=DEFAULT_PARTITION_TYPE))
+                 help='Defines the type of the partition. '
+                 f'Default: {DEFAULT_PARTITION_TYPE}')
 @optgroup.option('--description', type=str, required=False,
                  help='The description of the new partition.')
 @optgroup.option('--short-name', type=str, required=False,
@@ -278,56 +633,49 @@ def partition_dump(cmd_ctx, cpc, partition, **options):
                  'Default: No CP processors')
 @optgroup.option('--ifl-processors', type=int, required=False,
                  help='The number of IFL processors. '
-                 'Default: {d}, if no CP processors have been specified'.
-                 format(d=DEFAULT_IFL_PROCESSORS))
-@optgroup.option('--processor-mode', type=click.Choice(['dedicated', 'shared']),
+                 f'Default: {DEFAULT_IFL_PROCESSORS}, if no CP processors '
+                 'have been specified')
+@optgroup.option('--processor-mode', type=PROCESSOR_MODE_CHOICE,
                  required=False, default=DEFAULT_PROCESSOR_MODE,
                  help='The sharing mode for processors. '
-                 'Default: {d}'.format(d=DEFAULT_PROCESSOR_MODE))
+                 f'Default: {DEFAULT_PROCESSOR_MODE}')
 @optgroup.option('--processor-management-enabled', type=bool, required=False,
                  help='Indicates whether the processor management is enabled. '
                  'Default: false')
 @optgroup.option('--initial-cp-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT),
+                 type=PROCESSING_WEIGHT_RANGE,
                  required=False, default=DEFAULT_PROCESSING_WEIGHT,
                  help='Defines the initial processing weight of CP processors. '
-                 'Default: {d}'.format(d=DEFAULT_PROCESSING_WEIGHT))
+                 f'Default: {DEFAULT_PROCESSING_WEIGHT}')
 @optgroup.option('--initial-ifl-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT),
+                 type=PROCESSING_WEIGHT_RANGE,
                  required=False, default=DEFAULT_PROCESSING_WEIGHT,
                  help='Defines the initial processing weight of IFL '
-                 'processors. Default: {d}'.
-                 format(d=DEFAULT_PROCESSING_WEIGHT))
+                 f'processors. Default: {DEFAULT_PROCESSING_WEIGHT}')
 @optgroup.option('--minimum-ifl-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT),
+                 type=PROCESSING_WEIGHT_RANGE,
                  required=False, default=MIN_PROCESSING_WEIGHT,
                  help='Represents the minimum amount of IFL processor '
                  'resources allocated to the partition. '
-                 'Default: {d}'.format(d=MIN_PROCESSING_WEIGHT))
+                 f'Default: {MIN_PROCESSING_WEIGHT}')
 @optgroup.option('--minimum-cp-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT),
+                 type=PROCESSING_WEIGHT_RANGE,
                  required=False, default=MIN_PROCESSING_WEIGHT,
                  help='Represents the minimum amount of general purpose '
                  'processor resources allocated to the partition. '
-                 'Default: {d}'.format(d=MIN_PROCESSING_WEIGHT))
+                 f'Default: {MIN_PROCESSING_WEIGHT}')
 @optgroup.option('--maximum-ifl-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT),
+                 type=PROCESSING_WEIGHT_RANGE,
                  required=False, default=MAX_PROCESSING_WEIGHT,
                  help='Represents the maximum amount of IFL processor '
                  'resources allocated to the partition. '
-                 'Default: {d}'.format(d=MAX_PROCESSING_WEIGHT))
+                 f'Default: {MAX_PROCESSING_WEIGHT}')
 @optgroup.option('--maximum-cp-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT),
+                 type=PROCESSING_WEIGHT_RANGE,
                  required=False, default=MAX_PROCESSING_WEIGHT,
                  help='Represents the maximum amount of general purpose '
                  'processor resources allocated to the partition. '
-                 'Default: {d}'.format(d=MAX_PROCESSING_WEIGHT))
+                 f'Default: {MAX_PROCESSING_WEIGHT}')
 @optgroup.option('--cp-absolute-capping', type=float, required=False,
                  help='Absolute CP processor capping. A numeric value prevents '
                  'the partition from using any more than the specified number '
@@ -353,16 +701,16 @@ def partition_dump(cmd_ctx, cpc, partition, **options):
                  default=DEFAULT_INITIAL_MEMORY_MB,
                  help='The initial amount of memory (in MiB) when the '
                  'partition is started. '
-                 'Default: {d} MiB'.format(d=DEFAULT_INITIAL_MEMORY_MB))
+                 f'Default: {DEFAULT_INITIAL_MEMORY_MB} MiB')
 @optgroup.option('--maximum-memory', type=int, required=False,
                  default=DEFAULT_MAXIMUM_MEMORY_MB,
                  help='The maximum amount of memory (in MiB) to which the '
                  'partition\'s memory allocation can be increased while the '
                  'partition is running. '
-                 'Default: {d} MiB'.format(d=DEFAULT_MAXIMUM_MEMORY_MB))
+                 f'Default: {DEFAULT_MAXIMUM_MEMORY_MB} MiB')
 @optgroup.group('Boot configuration')
 @optgroup.option('--boot-timeout', required=False, metavar='INTEGER',
-                 type=click.IntRange(MIN_BOOT_TIMEOUT, MAX_BOOT_TIMEOUT),
+                 type=BOOT_TIMEOUT_RANGE,
                  help='The time in seconds that is waited before an ongoing '
                  'boot is aborted. This is applicable for all boot sources. '
                  'Default: 60')
@@ -381,7 +729,7 @@ def partition_dump(cmd_ctx, cpc, partition, **options):
 @optgroup.option('--boot-media-file', type=str, required=False,
                  help='Boot from removable media on the HMC: The path to the '
                  'image file on the HMC.')
-@optgroup.option('--boot-media-type', type=click.Choice(['usb', 'cdrom']),
+@optgroup.option('--boot-media-type', type=BOOT_MEDIA_TYPE_CHOICE,
                  required=False,
                  help='Boot from removable media on the HMC: The type of media.'
                  ' Must be specified if --boot-media-file is specified.')
@@ -484,38 +832,32 @@ def partition_create(cmd_ctx, cpc, **options):
                  help='The new number of general purpose (CP) processors.')
 @optgroup.option('--ifl-processors', type=int, required=False,
                  help='The new number of IFL processors.')
-@optgroup.option('--processor-mode', type=click.Choice(['dedicated', 'shared']),
+@optgroup.option('--processor-mode', type=PROCESSOR_MODE_CHOICE,
                  required=False,
                  help='The new sharing mode for processors.')
 @optgroup.option('--processor-management-enabled', type=bool, required=False,
                  help='Indicates whether the processor management is enabled.')
 @optgroup.option('--initial-cp-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT), required=False,
+                 type=PROCESSING_WEIGHT_RANGE, required=False,
                  help='Defines the initial processing weight of CP processors.')
 @optgroup.option('--initial-ifl-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT), required=False,
+                 type=PROCESSING_WEIGHT_RANGE, required=False,
                  help='Defines the initial processing weight of IFL '
                  'processors.')
 @optgroup.option('--minimum-ifl-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT), required=False,
+                 type=PROCESSING_WEIGHT_RANGE, required=False,
                  help='Represents the minimum amount of IFL processor '
                  'resources allocated to the partition.')
 @optgroup.option('--minimum-cp-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT), required=False,
+                 type=PROCESSING_WEIGHT_RANGE, required=False,
                  help='Represents the minimum amount of general purpose '
                  'processor resources allocated to the partition.')
 @optgroup.option('--maximum-ifl-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT), required=False,
+                 type=PROCESSING_WEIGHT_RANGE, required=False,
                  help='Represents the maximum amount of IFL processor '
                  'resources allocated to the partition.')
 @optgroup.option('--maximum-cp-processing-weight',
-                 type=click.IntRange(MIN_PROCESSING_WEIGHT,
-                                     MAX_PROCESSING_WEIGHT), required=False,
+                 type=PROCESSING_WEIGHT_RANGE, required=False,
                  help='Represents the maximum amount of general purpose '
                  'processor resources allocated to the partition.')
 @optgroup.option('--cp-absolute-capping', type=float, required=False,
@@ -548,19 +890,8 @@ def partition_create(cmd_ctx, cpc, **options):
                  'partition is running.')
 @optgroup.group('Boot configuration')
 @optgroup.option('--boot-storage-volume', type=str, required=False,
-                 help='Boot from a storage volume. '
-                 'For CPCs with the storage management feature (z14 and '
-                 'later): A string of the form "SG/SV" where SG is the name of '
-                 'the storage group attached to the partition and SV is the '
-                 'name of the storage volume in that storage group, or of the '
-                 'form "UUID" where UUID is the UUID of the storage volume on '
-                 'the storage array (also shown in the HMC GUI). The storage '
-                 'volume may be of type FCP or FICON. '
-                 'For CPCs without the storage management feature (z13 and '
-                 'earlier): A string of the form "HBA/WWPN/LUN", where HBA is '
-                 'the name of the HBA to be used and WWPN and LUN identify the '
-                 'storage array and storage volume thereon. The storage volume '
-                 'must be of type FCP.')
+                 help='Boot from a storage '
+                 'volume. ' + STORAGE_VOLUME_FORMATS_HELP)
 @optgroup.option('--boot-storage-hba', type=str, required=False,
                  help='Boot from an FCP storage volume: The name of the HBA to '
                  'be used. '
@@ -590,7 +921,7 @@ def partition_create(cmd_ctx, cpc, **options):
 @optgroup.option('--boot-media-file', type=str, required=False,
                  help='Boot from removable media on the HMC: The path to the '
                  'image file on the HMC.')
-@optgroup.option('--boot-media-type', type=click.Choice(['usb', 'cdrom']),
+@optgroup.option('--boot-media-type', type=BOOT_MEDIA_TYPE_CHOICE,
                  required=False,
                  help='Boot from removable media on the HMC: The type of '
                  'media. Must be specified if --boot-media-file is specified.')
@@ -602,7 +933,7 @@ def partition_create(cmd_ctx, cpc, **options):
                  help='Boot from an ISO image: The path to the INS-file in the '
                  'boot image.')
 @optgroup.option('--boot-timeout', required=False, metavar='INTEGER',
-                 type=click.IntRange(MIN_BOOT_TIMEOUT, MAX_BOOT_TIMEOUT),
+                 type=BOOT_TIMEOUT_RANGE,
                  help='The time in seconds that is waited before an ongoing '
                  'boot is aborted. This is applicable for all boot sources.')
 @optgroup.option('--boot-ficon-loader-mode', required=False,
@@ -1104,48 +1435,45 @@ Help for usage related options of the partition list command:
 
     client = zhmcclient.Client(cmd_ctx.session)
 
+    usage_option = options['memory_usage'] or options['ifl_usage'] or \
+        options['cp_usage']
+
     show_list = [
         'name',
         'cpc'
     ]
     if not options['names_only']:
-        show_list.extend([
-            'short-name',
-            'status',
-            'type',
-            'os-name',
-            'os-type',
-            'os-version',
-            'description',
-        ])
+        show_list.extend(PARTITION_LIST_PROPS)
+        if not usage_option:
+            show_list.append('description')
     if options['uri']:
         show_list.extend([
             'object-uri',
         ])
 
     if options['memory_usage']:
-        try:
-            show_list.remove('description')
-        except ValueError:
-            pass
         show_list.extend([
             'reserve-resources',
             'initial-memory',
         ])
 
     if options['ifl_usage'] or options['cp_usage']:
-        try:
-            show_list.remove('description')
-        except ValueError:
-            pass
-        show_list.append('reserve-resources')
-        show_list.append('processor-mode')
+        show_list.extend([
+            'reserve-resources',
+            'processor-mode',
+        ])
 
     # Make sure to include only properties in additional properties
     # that are known resource properties and are not included in the
     # default set of properties for a list operation.
     standard_props = ['name', 'cpc', 'status', 'type']
     additional_props = [p for p in show_list if p not in standard_props]
+    if options['ifl_usage'] or options['cp_usage']:
+        additional_props.extend(PARTITION_USAGE_PROPS)
+
+    # Indicates whether the additional properties are returned by the list
+    # operation
+    listed_additional_props = False
 
     if cpc_name:
         # Make sure a non-existing CPC is raised as error
@@ -1153,6 +1481,7 @@ Help for usage related options of the partition list command:
         if (client.version_info() >= API_VERSION_HMC_2_16_0):
             partitions = cpc.partitions.list(
                 additional_properties=additional_props)
+            listed_additional_props = True
         else:
             partitions = cpc.partitions.list()
     elif client.version_info() >= API_VERSION_HMC_2_14_0:
@@ -1164,13 +1493,16 @@ Help for usage related options of the partition list command:
            ('dpm-hipersockets-partition-link-management' in console_features):
             partitions = client.consoles.console.list_permitted_partitions(
                 additional_properties=additional_props)
+            listed_additional_props = True
         else:
             partitions = client.consoles.console.list_permitted_partitions()
     else:
+        # The partitions of the CPCs are listed concurrently, since the
+        # elapsed time is dominated by the HMC round trips.
         partitions = []
-        cpcs = client.cpcs.list()
-        for cpc in cpcs:
-            partitions.extend(cpc.partitions.list())
+        for cpc_partitions in concurrent_map(
+                lambda c: c.partitions.list(), client.cpcs.list()):
+            partitions.extend(cpc_partitions)
     # The default exception handling is sufficient for the above.
 
     if options['type']:
@@ -1180,93 +1512,80 @@ Help for usage related options of the partition list command:
     # Prepare the additions dict of dicts. It contains additional
     # (=non-resource) property values by property name and by resource URI.
     # Depending on options, some of them will not be populated.
-    additions = {}
-    additions['ifl-capacity'] = {}
-    additions['ifls'] = {}
-    additions['ifl-weight'] = {}
-    additions['cp-capacity'] = {}
-    additions['cps'] = {}
-    additions['cp-weight'] = {}
-    additions['processor-usage'] = {}
-    additions['processors-used'] = {}
-    additions['cpc'] = {}
+    additions = {name: {} for name in PARTITION_LIST_ADDITIONS}
 
     if options['ifl_usage'] or options['cp_usage']:
 
-        for p in partitions:
-            p.pull_full_properties()
+        if not listed_additional_props:
+            concurrent_map(lambda p: p.pull_full_properties(), partitions)
 
-        # Calculate effective IFLs and add it
-        total_ifls = {}  # by CPC name
-        total_ifl_weight = {}  # by CPC name
+        # Calculate the total IFL and CP weights of the active partitions in
+        # shared processor mode, by CPC name
+        shared_cpcs = {}  # by CPC name
+        total_ifl_weight = {}
+        total_cp_weight = {}
         for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['processor-mode'] == 'shared' and \
-                    p.properties['status'] == 'active':
-                if cpc.name not in total_ifl_weight:
+            props = p.properties
+            if props['processor-mode'] == 'shared' and \
+                    props['status'] == 'active':
+                cpc = p.manager.parent
+                if cpc.name not in shared_cpcs:
+                    shared_cpcs[cpc.name] = cpc
                     total_ifl_weight[cpc.name] = 0
-                    total_ifls[cpc.name] = cpc.prop('processor-count-ifl')
+                    total_cp_weight[cpc.name] = 0
                 total_ifl_weight[cpc.name] += \
-                    p.properties['initial-ifl-processing-weight']
+                    props['initial-ifl-processing-weight']
+                total_cp_weight[cpc.name] += \
+                    props['initial-cp-processing-weight']
+
+        # Get the total IFLs and CPs of these CPCs. Only the processor count
+        # properties are retrieved, concurrently for the CPCs.
+        concurrent_map(lambda c: c.pull_properties(CPC_PROCESSOR_COUNT_PROPS),
+                       shared_cpcs.values())
+        total_ifls = {name: cpc.prop('processor-count-ifl')
+                      for name, cpc in shared_cpcs.items()}
+        total_cps = {name: cpc.prop('processor-count-general-purpose')
+                     for name, cpc in shared_cpcs.items()}
+
+        # Calculate effective IFLs and CPs and add them
         for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['status'] != 'active':
+            props = p.properties
+            ifl_weight = props['initial-ifl-processing-weight']
+            cp_weight = props['initial-cp-processing-weight']
+            if props['status'] != 'active':
                 ifls_eff = None
-            elif p.properties['processor-mode'] == 'shared':
-                ifl_weight = p.properties['initial-ifl-processing-weight']
+                cps_eff = None
+            elif props['processor-mode'] == 'shared':
+                cpc = p.manager.parent
                 ifls_eff = float(total_ifls[cpc.name]) * ifl_weight / \
                     total_ifl_weight[cpc.name]
-            else:
-                ifls_eff = float(p.properties['ifl-processors'])
-            additions['ifl-capacity'][p.uri] = ifls_eff
-            additions['ifls'][p.uri] = p.properties['ifl-processors']
-            additions['ifl-weight'][p.uri] = \
-                p.properties['initial-ifl-processing-weight']
-
-        # Calculate effective CPs and add it
-        total_cps = {}  # by CPC name
-        total_cp_weight = {}  # by CPC name
-        for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['processor-mode'] == 'shared' and \
-                    p.properties['status'] == 'active':
-                if cpc.name not in total_cp_weight:
-                    total_cp_weight[cpc.name] = 0
-                    total_cps[cpc.name] = \
-                        cpc.prop('processor-count-general-purpose')
-                total_cp_weight[cpc.name] += \
-                    p.properties['initial-cp-processing-weight']
-        for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['status'] != 'active':
-                cps_eff = None
-            elif p.properties['processor-mode'] == 'shared':
-                cp_weight = p.properties['initial-cp-processing-weight']
                 cps_eff = float(total_cps[cpc.name]) * cp_weight / \
                     total_cp_weight[cpc.name]
             else:
-                cps_eff = float(p.properties['cp-processors'])
+                ifls_eff = float(props['ifl-processors'])
+                cps_eff = float(props['cp-processors'])
+            additions['ifl-capacity'][p.uri] = ifls_eff
+            additions['ifls'][p.uri] = props['ifl-processors']
+            additions['ifl-weight'][p.uri] = ifl_weight
             additions['cp-capacity'][p.uri] = cps_eff
-            additions['cps'][p.uri] = p.properties['cp-processors']
-            additions['cp-weight'][p.uri] = \
-                p.properties['initial-cp-processing-weight']
-
-        # Get processor-usage metrics and add it
+            additions['cps'][p.uri] = props['cp-processors']
+            additions['cp-weight'][p.uri] = cp_weight
+
+        # Get processor-usage metrics and add it.
+        # The metric values are looked up by partition URI. This avoids
+        # resolving the resource object of each metric value, which takes an
+        # HMC request per partition, and it distinguishes partitions with the
+        # same name on different CPCs. For the same reason, the metric values
+        # are not filtered by CPC; only those of the listed partitions are
+        # used.
         metric_group = 'partition-usage'
-        resource_filter = []
-        if cpc_name:
-            resource_filter.append(('cpc', cpc_name))
-        mov_list, _ = get_metric_values(
-            client, metric_group, resource_filter)
-        partition_metrics = {}
-        for mov in mov_list:
-            assert isinstance(mov.resource, zhmcclient.Partition)
-            p_name = mov.resource.name
-            partition_metrics[p_name] = mov.metrics
+        mov_list, _ = get_metric_values(client, metric_group, [])
+        partition_metrics = {mov.resource_uri: mov.metrics
+                             for mov in mov_list}
         for p in partitions:
             # Note: Partitions that are stopped have no metrics value for
             # partition-usage.
-            p_metrics = partition_metrics.get(p.name, None)
+            p_metrics = partition_metrics.get(p.uri, None)
             if p_metrics:
                 usage = p_metrics['processor-usage']
                 # Independent of sharing mode:
@@ -1280,17 +1599,23 @@ Help for usage related options of the partition list command:
             additions['processors-used'][p.uri] = used
 
         if options['ifl_usage']:
-            show_list.append('ifls')
-            show_list.append('ifl-weight')
-            show_list.append('ifl-capacity')
+            show_list.extend([
+                'ifls',
+                'ifl-weight',
+                'ifl-capacity',
+            ])
 
         if options['cp_usage']:
-            show_list.append('cps')
-            show_list.append('cp-weight')
-            show_list.append('cp-capacity')
+            show_list.extend([
+                'cps',
+                'cp-weight',
+                'cp-capacity',
+            ])
 
-        show_list.append('processor-usage')
-        show_list.append('processors-used')
+        show_list.extend([
+            'processor-usage',
+            'processors-used',
+        ])
 
     for p in partitions:
         cpc = p.manager.parent
@@ -1323,12 +1648,12 @@ def cmd_partition_show(cmd_ctx, cpc_name, partition_name, options):
     if not options['all'] and cmd_ctx.output_format in TABLE_FORMATS:
         hide_property(properties, 'crypto-configuration')
 
-    # Add artificial property 'nic-names'
-    nic_names = []
-    for nic_uri in partition.properties['nic-uris']:
-        nic_props = client.session.get(nic_uri)
-        nic_names.append(nic_props['name'])
-    properties['nic-names'] = nic_names
+    # Add artificial property 'nic-names'. The HMC has no operation that
+    # returns the names of all NICs of a partition, so the NICs are
+    # retrieved concurrently.
+    properties['nic-names'] = concurrent_map(
+        lambda uri: client.session.get(uri)['name'],
+        partition.properties['nic-uris'])
 
     print_properties(cmd_ctx, properties, cmd_ctx.output_format)
 
@@ -1365,59 +1690,80 @@ def cmd_partition_stop(cmd_ctx, cpc_name, partition_name, options):
     click.echo(f"Partition '{partition_name}' has been stopped.")
 
 
-def cmd_partition_create(cmd_ctx, cpc_name, options):
-    # pylint: disable=missing-function-docstring
+def cmd_partition_start_stop_many(cmd_ctx, cpc_name, action, options):
+    """
+    Start or stop multiple partitions.
+
+    The asynchronous start or stop operations are submitted for all
+    partitions first. Then, their jobs and the resulting partition status are
+    waited for. Partitions that are specified more than once are started or
+    stopped only once. Failures to submit an operation, of its job or when
+    waiting for the partition status are reported together, after all
+    submitted jobs have been waited for.
+
+    Parameters:
+
+      action (string): 'start' or 'stop'.
+    """
 
     client = zhmcclient.Client(cmd_ctx.session)
-    cpc = find_cpc(cmd_ctx, client, cpc_name)
+    partition_names = list(dict.fromkeys(options['partition']))
+    partitions = [find_partition(cmd_ctx, client, cpc_name, name)
+                  for name in partition_names]
+
+    jobs = []
+    failures = []
+    for partition in partitions:
+        operation = getattr(partition, action)
+        try:
+            job = operation(wait_for_completion=False)
+        except zhmcclient.Error as exc:
+            failures.append(f"Partition '{partition.name}': {exc}")
+        else:
+            jobs.append((partition, job))
+
+    # Like 'partition start' and 'partition stop', wait for the partition
+    # status that results from the operation after its job has completed.
+    statuses = ['active', 'degraded'] if action == 'start' else ['stopped']
+    done_names = []
+    for partition, job in jobs:
+        try:
+            job.wait_for_completion(
+                operation_timeout=options['operation_timeout'])
+            partition.wait_for_status(statuses)
+        except zhmcclient.Error as exc:
+            failures.append(f"Partition '{partition.name}': {exc}")
+        else:
+            done_names.append(partition.name)
 
-    # The following options are handled specifically in this function (as
-    # opposed to be handled generically in options_to_properties()):
+    cmd_ctx.spinner.stop()
+    past_action = 'started' if action == 'start' else 'stopped'
+    for name in done_names:
+        click.echo(f"Partition '{name}' has been {past_action}.")
+    if failures:
+        raise click_exception(
+            "Failed to {a} {n} of {t} partitions: {f}".
+            format(a=action, n=len(failures), t=len(partitions),
+                   f='; '.join(failures)),
+            cmd_ctx.error_format)
 
-    # The options for booting from an FTP server.
-    # They need to be specified together, all of them are required.
-    boot_ftp_option_names = (
-        'boot-ftp-host',
-        'boot-ftp-username',
-        'boot-ftp-password',
-        'boot-ftp-insfile',
-    )
 
-    # The option for booting from an HMC media file.
-    boot_media_option_names = (
-        'boot-media-file',
-        'boot-media-type',
-    )
+def cmd_partition_create(cmd_ctx, cpc_name, options):
+    # pylint: disable=missing-function-docstring
 
-    # Specially handled options
-    special_option_names = (
-        'partition-id',
-        'acceptable-status',
-        'ssc-dns-servers',
-        'ssc-ipv4-gateway',
-        'ssc-ipv6-gateway',
-        'cp-absolute-capping',
-        'ifl-absolute-capping',
-    )
-
-    # Options handled in this function
-    special_opt_names = boot_ftp_option_names + boot_media_option_names + \
-        special_option_names
-    name_map = {opt: None for opt in special_opt_names}
+    client = zhmcclient.Client(cmd_ctx.session)
+    cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     org_options = original_options(options)
-    properties = options_to_properties(org_options, name_map)
+    properties = options_to_properties(
+        org_options, PARTITION_CREATE_NAME_MAP)
 
     # Used and missing options handled in this function
-    used_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is not None]
-    missing_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is None]
+    used_boot_ftp_opts, missing_boot_ftp_opts = used_and_missing_options(
+        org_options, BOOT_FTP_OPTION_NAMES)
 
     used_boot_media_opts = [
-        '--' + name for name in boot_media_option_names
+        '--' + name for name in CREATE_BOOT_MEDIA_OPTION_NAMES
         if org_options[name] is not None]
 
     used_boot_opts = used_boot_ftp_opts + used_boot_media_opts
@@ -1456,44 +1802,7 @@ def cmd_partition_create(cmd_ctx, cpc_name, options):
         properties['ifl-processors'] = DEFAULT_IFL_PROCESSORS
 
     # Specially handled options
-
-    if org_options['partition-id'] == "auto":
-        properties['autogenerate-partition-id'] = True
-    elif org_options['partition-id'] is not None:
-        partition_id = "{:02X}".format(org_options['partition-id'])
-        properties['partition-id'] = partition_id
-        properties['autogenerate-partition-id'] = False
-
-    if org_options['acceptable-status'] is not None:
-        status_list = org_options['acceptable-status'].split(',')
-        status_list = [item for item in status_list if item]
-        properties['acceptable-status'] = status_list
-
-    if org_options['ssc-dns-servers'] == '':
-        properties['ssc-dns-servers'] = []
-    elif org_options['ssc-dns-servers'] is not None:
-        properties['ssc-dns-servers'] = \
-            org_options['ssc-dns-servers'].split(',')
-
-    if org_options['ssc-ipv4-gateway'] == '':
-        properties['ssc-ipv4-gateway'] = None
-
-    if org_options['ssc-ipv6-gateway'] == '':
-        properties['ssc-ipv6-gateway'] = None
-
-    if org_options['cp-absolute-capping'] == '':
-        properties['cp-absolute-processor-capping'] = False
-    elif org_options['cp-absolute-capping'] is not None:
-        properties['cp-absolute-processor-capping'] = True
-        properties['cp-absolute-processor-capping-value'] = \
-            org_options['cp-absolute-capping']
-
-    if org_options['ifl-absolute-capping'] == '':
-        properties['ifl-absolute-processor-capping'] = False
-    elif org_options['ifl-absolute-capping'] is not None:
-        properties['ifl-absolute-processor-capping'] = True
-        properties['ifl-absolute-processor-capping-value'] = \
-            org_options['ifl-absolute-capping']
+    special_options_to_properties(cmd_ctx, org_options, properties)
 
     try:
         new_partition = cpc.partitions.create(properties)
@@ -1511,112 +1820,31 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
     client = zhmcclient.Client(cmd_ctx.session)
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
-    # The following options are handled specifically in this function (as
-    # opposed to be handled generically in options_to_properties()):
-
-    # The option for booting from a storage volume.
-    # For consistency, a list is used even though it is a single option.
-    boot_storage_option_names = (
-        'boot-storage-volume',
-    )
-
-    # The deprecated options for booting from an FCP storage volume.
-    # They need to be specified together, all of them are required.
-    old_boot_storage_option_names = (
-        'boot-storage-hba',
-        'boot-storage-lun',
-        'boot-storage-wwpn',
-    )
-
-    # The option for booting from a PXE server.
-    # For consistency, a list is used even though it is a single option.
-    boot_network_option_names = (
-        'boot-network-nic',
-    )
-
-    # The options for booting from an FTP server.
-    # They need to be specified together, all of them are required.
-    boot_ftp_option_names = (
-        'boot-ftp-host',
-        'boot-ftp-username',
-        'boot-ftp-password',
-        'boot-ftp-insfile',
-    )
-
-    # The option for booting from an HMC media file.
-    # For consistency, a list is used even though it is a single option.
-    boot_media_option_names = (
-        'boot-media-file',
-    )
-
-    # The option for booting from an HMC ISO image.
-    # For consistency, a list is used even though it is a single option.
-    boot_iso_option_names = (
-        'boot-iso',
-    )
-
-    # Specially handled options
-    special_option_names = (
-        'partition-id',
-        'acceptable-status',
-        'ssc-dns-servers',
-        'ssc-ipv4-gateway',
-        'ssc-ipv6-gateway',
-        'cp-absolute-capping',
-        'ifl-absolute-capping',
-        'boot-ficon-loader-mode',
-        'boot-record-lba',
-        'boot-record-location',
-        'boot-configuration',
-    )
-
-    # Addiional name mapping
-    additional_name_mapping = {
-        # option name: HMC property name
-        'boot-iso-insfile': 'boot-iso-ins-file',
-    }
-
-    # Options handled in this function
-    special_opt_names = \
-        boot_storage_option_names + old_boot_storage_option_names + \
-        boot_network_option_names + boot_ftp_option_names + \
-        boot_media_option_names + boot_iso_option_names + \
-        special_option_names
-    name_map = {opt: None for opt in special_opt_names}
-    name_map.update(additional_name_mapping)
-
     org_options = original_options(options)
-    properties = options_to_properties(org_options, name_map)
+    properties = options_to_properties(
+        org_options, PARTITION_UPDATE_NAME_MAP)
 
     # Used and missing options handled in this function
     used_boot_storage_opts = [
-        '--' + name for name in boot_storage_option_names
+        '--' + name for name in BOOT_STORAGE_OPTION_NAMES
         if org_options[name] is not None]
 
-    used_old_boot_storage_opts = [
-        '--' + name for name in old_boot_storage_option_names
-        if org_options[name] is not None]
-    missing_old_boot_storage_opts = [
-        '--' + name for name in old_boot_storage_option_names
-        if org_options[name] is None]
+    used_old_boot_storage_opts, missing_old_boot_storage_opts = \
+        used_and_missing_options(org_options, OLD_BOOT_STORAGE_OPTION_NAMES)
 
     used_boot_network_opts = [
-        '--' + name for name in boot_network_option_names
+        '--' + name for name in BOOT_NETWORK_OPTION_NAMES
         if org_options[name] is not None]
 
-    used_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is not None]
-    missing_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is None]
+    used_boot_ftp_opts, missing_boot_ftp_opts = used_and_missing_options(
+        org_options, BOOT_FTP_OPTION_NAMES)
 
     used_boot_media_opts = [
-        '--' + name for name in boot_media_option_names
+        '--' + name for name in UPDATE_BOOT_MEDIA_OPTION_NAMES
         if org_options[name] is not None]
 
     used_boot_iso_opts = [
-        '--' + name for name in boot_iso_option_names
+        '--' + name for name in BOOT_ISO_OPTION_NAMES
         if org_options[name]]  # is_flag options default to False
 
     if used_boot_storage_opts and used_old_boot_storage_opts:
@@ -1721,44 +1949,7 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
         pass
 
     # Specially handled options
-
-    if org_options['partition-id'] == "auto":
-        properties['autogenerate-partition-id'] = True
-    elif org_options['partition-id'] is not None:
-        partition_id = "{:02X}".format(org_options['partition-id'])
-        properties['partition-id'] = partition_id
-        properties['autogenerate-partition-id'] = False
-
-    if org_options['acceptable-status'] is not None:
-        status_list = org_options['acceptable-status'].split(',')
-        status_list = [item for item in status_list if item]
-        properties['acceptable-status'] = status_list
-
-    if org_options['ssc-dns-servers'] == '':
-        properties['ssc-dns-servers'] = []
-    elif org_options['ssc-dns-servers'] is not None:
-        properties['ssc-dns-servers'] = \
-            org_options['ssc-dns-servers'].split(',')
-
-    if org_options['ssc-ipv4-gateway'] == '':
-        properties['ssc-ipv4-gateway'] = None
-
-    if org_options['ssc-ipv6-gateway'] == '':
-        properties['ssc-ipv6-gateway'] = None
-
-    if org_options['cp-absolute-capping'] == '':
-        properties['cp-absolute-processor-capping'] = False
-    elif org_options['cp-absolute-capping'] is not None:
-        properties['cp-absolute-processor-capping'] = True
-        properties['cp-absolute-processor-capping-value'] = \
-            org_options['cp-absolute-capping']
-
-    if org_options['ifl-absolute-capping'] == '':
-        properties['ifl-absolute-processor-capping'] = False
-    elif org_options['ifl-absolute-capping'] is not None:
-        properties['ifl-absolute-processor-capping'] = True
-        properties['ifl-absolute-processor-capping-value'] = \
-            org_options['ifl-absolute-capping']
+    special_options_to_properties(cmd_ctx, org_options, properties)
 
     if org_options['boot-ficon-loader-mode'] == 'ccw':
         properties['boot-loader-mode'] = 'channel-command-word'
@@ -1774,7 +1965,7 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
         properties['boot-record-location'] = None
     elif org_options['boot-record-location'] is not None:
         value = org_options['boot-record-location']
-        m = re.match(r'([0-9A-F]+)\.([0-9A-F]+)\.([0-9A-F]+)$', value, re.I)
+        m = BOOT_RECORD_LOCATION_PATTERN.match(value)
         if not m:
             raise click_exception(
                 "Invalid format specified for --boot-record-location "
@@ -1961,7 +2152,7 @@ def cmd_partition_unmount_iso(cmd_ctx, cpc_name, partition_name):
     client = zhmcclient.Client(cmd_ctx.session)
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
-    partition.pull_full_properties()
+    partition.pull_properties(['boot-iso-image-name', 'boot-device'])
     image_name = partition.get_property('boot-iso-image-name')
     if image_name:
         boot_device = partition.get_property('boot-device')
@@ -1983,11 +2174,6 @@ def cmd_partition_list_storagegroups(cmd_ctx, cpc_name, partition_name):
     client = zhmcclient.Client(cmd_ctx.session)
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
-    try:
-        stogrps = partition.list_attached_storage_groups()
-    except zhmcclient.Error as exc:
-        raise click_exception(exc, cmd_ctx.error_format)
-
     show_list = [
         'name',
         'type',
@@ -1995,6 +2181,11 @@ def cmd_partition_list_storagegroups(cmd_ctx, cpc_name, partition_name):
         'fulfillment-state',
     ]
 
+    try:
+        stogrps = attached_storage_groups(partition, show_list)
+    except zhmcclient.Error as exc:
+        raise click_exception(exc, cmd_ctx.error_format)
+
     try:
         print_resources(cmd_ctx, stogrps, cmd_ctx.output_format, show_list)
     except zhmcclient.Error as exc:
@@ -2085,14 +2276,16 @@ def cmd_partition_show_crypto(cmd_ctx, cpc_name, partition_name):
     # pylint: disable=missing-function-docstring
 
     client = zhmcclient.Client(cmd_ctx.session)
-    cpc = find_cpc(cmd_ctx, client, cpc_name)
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
+    # The parent CPC of the partition is used, in order not to look up the
+    # CPC by name again.
+    cpc = partition.manager.parent
 
     partition.pull_properties('crypto-configuration')
     config = partition.properties['crypto-configuration']
 
     if config:
-        adapter_uris = config['crypto-adapter-uris']
+        adapter_uris = set(config['crypto-adapter-uris'])
         domain_configs = config['crypto-domain-configurations']
         adapters = [a for a in cpc.adapters.list() if a.uri in adapter_uris]
         props_list = domain_config_to_props_list(
@@ -2121,15 +2314,13 @@ def cmd_partition_add_crypto(cmd_ctx, cpc_name, partition_name, options):
     usage_domains_option = options['usage_domains']
     control_domains_option = options['control_domains']
 
-    adapters = []
     if adapters_option:
         adapter_names = parse_adapter_names(
             cmd_ctx, '--adapters', adapters_option)
-        for adapter_name in adapter_names:
-            adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
-            adapters.append(adapter)
+        adapters = find_adapters(cmd_ctx, client, cpc_name, adapter_names)
     else:
         adapter_names = []
+        adapters = []
 
     if usage_domains_option:
         usage_domains = parse_crypto_domains(
@@ -2170,15 +2361,13 @@ def cmd_partition_remove_crypto(
     adapters_option = options['adapters']
     domains_option = options['domains']
 
-    adapters = []
     if adapters_option:
         adapter_names = parse_adapter_names(
             cmd_ctx, '--adapters', adapters_option)
-        for adapter_name in adapter_names:
-            adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
-            adapters.append(adapter)
+        adapters = find_adapters(cmd_ctx, client, cpc_name, adapter_names)
     else:
         adapter_names = []
+        adapters = []
 
     if domains_option:
         domains = parse_crypto_domains(cmd_ctx, '--domains', domains_option)
@@ -2211,26 +2400,34 @@ def cmd_partition_zeroize_crypto(
     adapters_option = options['adapters']  # required
     domains_option = options['domains']  # required
 
-    adapters = []
     adapter_names = parse_adapter_names(cmd_ctx, '--adapters', adapters_option)
-    for adapter_name in adapter_names:
-        adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
-        adapters.append(adapter)
+    adapters = find_adapters(cmd_ctx, client, cpc_name, adapter_names)
 
     domains = parse_crypto_domains(cmd_ctx, '--domains', domains_option)
 
+    def zeroize(adapter_domain):
+        adapter, domain = adapter_domain
+        try:
+            partition.zeroize_crypto_domain(adapter, domain)
+        except zhmcclient.Error as exc:
+            return exc
+        return None
+
+    # The crypto domains are zeroized using concurrent HMC requests. A
+    # zeroize that is retried after a re-logon of the shared session just
+    # zeroizes the domain again. Errors are shown in the order of the
+    # adapters and domains.
+    adapter_domains = [(a, d) for a in adapters for d in domains]
+    results = concurrent_map(zeroize, adapter_domains)
     errors = 0
-    for adapter in adapters:
-        for domain in domains:
-            try:
-                partition.zeroize_crypto_domain(adapter, domain)
-            except zhmcclient.Error as exc:
-                errors += 1
-                cmd_ctx.spinner.stop()
-                click.echo(
-                    "Error zeroizing crypto domain {d!r} on adapter {a!r}: "
-                    "{exc} - continuing with next domain/adapter".
-                    format(d=domain, a=adapter.name, exc=exc))
+    for (adapter, domain), exc in zip(adapter_domains, results):
+        if exc:
+            errors += 1
+            cmd_ctx.spinner.stop()
+            click.echo(
+                "Error zeroizing crypto domain {d!r} on adapter {a!r}: "
+                "{exc} - continuing with next domain/adapter".
+                format(d=domain, a=adapter.name, exc=exc))
 
     cmd_ctx.spinner.stop()
     if errors:
@@ -2286,14 +2483,17 @@ def parse_volume_with_sm(volume_specifier, partition, where, error_format):
 
     if len(volume_parts) == 1:  # format: UUID
         uuid = volume_parts[0]
-        sg_list = partition.list_attached_storage_groups()
-        storage_volume = None
-        for sg in sg_list:
+        sg_list = attached_storage_groups(partition, [])
+
+        def find_volume(sg):
             try:
-                storage_volume = sg.storage_volumes.find(uuid=uuid)
-                break
+                return sg.storage_volumes.find(uuid=uuid)
             except zhmcclient.NotFound:
-                continue
+                return None
+
+        # The storage groups are searched using concurrent HMC requests.
+        storage_volume = next(
+            (sv for sv in concurrent_map(find_volume, sg_list) if sv), None)
         if not storage_volume:
             raise click_exception(
                 "Storage volume with UUID '{uuid}' specified in "
@@ -2306,7 +2506,7 @@ def parse_volume_with_sm(volume_specifier, partition, where, error_format):
 
     if len(volume_parts) == 2:  # format: SG/SV
         sg_name, sv_name = volume_parts
-        sg_list = partition.list_attached_storage_groups()
+        sg_list = attached_storage_groups(partition, ['name'])
         sg = None
         for _sg in sg_list:
             if _sg.name == sg_name:
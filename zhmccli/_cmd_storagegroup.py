@@ -54,12 +54,22 @@ DEFAULT_DIRECT_CONNECTION_COUNT = 0
 def find_storagegroup(cmd_ctx, client, stogrp_name):
     """
     Find a storage group by name and return its resource object.
+
+    The result is cached for the scope of the command, so that repeated
+    lookups of the same storage group do not cause additional HMC requests.
     """
+    cache = cmd_ctx.lookup_cache(client)
+    cache_key = ('storagegroup', stogrp_name)
+    if cache_key in cache:
+        return cache[cache_key]
+
     console = client.consoles.console
     try:
         stogrp = console.storage_groups.find(name=stogrp_name)
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
+
+    cache[cache_key] = stogrp
     return stogrp
 
 
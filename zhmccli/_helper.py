@@ -23,6 +23,7 @@ import sys
 import os
 import shutil
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import re
 import jsonschema
 import click
@@ -65,6 +66,9 @@ LOG_LEVELS = ['error', 'warning', 'info', 'debug']
 
 LOG_COMPONENTS = ['api', 'hmc', 'console', 'all']
 
+# Maximum number of concurrent HMC requests issued by concurrent_map()
+MAX_PARALLEL_PULLS = 8
+
 SYSLOG_FACILITIES = ['user', 'local0', 'local1', 'local2', 'local3', 'local4',
                      'local5', 'local6', 'local7']
 
@@ -238,6 +242,8 @@ class CmdContext:
         self._session = None
         self._spinner = click_spinner.Spinner()
         self._pdb = pdb
+        self._lookup_cache = None
+        self._lookup_cache_client = None
 
     def __repr__(self):
         ret = "CmdContext(at 0x{ctx:08x}, host={s._host!r}, " \
@@ -352,6 +358,30 @@ class CmdContext:
         """
         return self._pdb
 
+    def lookup_cache(self, client):
+        """
+        Return a dictionary for caching the results of resource lookups
+        (e.g. by name) within the scope of a single zhmc command.
+
+        The cache is bound to the :class:`zhmcclient.Client` object of the
+        command. When a different client object is specified (e.g. by the next
+        command in interactive mode), a new empty cache is returned, so that
+        no stale results are used across commands.
+
+        Parameters:
+
+          client (:class:`zhmcclient.Client`): The client of the command.
+
+        Returns:
+
+          dict: The cache (key: a tuple defined by the user of the cache,
+          value: the cached result).
+        """
+        if self._lookup_cache_client is not client:
+            self._lookup_cache = {}
+            self._lookup_cache_client = client
+        return self._lookup_cache
+
     def execute_cmd(self, cmd, logoff=True):
         """
         Execute the command.
@@ -721,24 +751,32 @@ def print_resources_as_table(
     prop_names = OrderedDict()  # key: property name, value: None
     remaining_prop_names = OrderedDict()  # key: property name, value: None
     resource_props_list = []
+    if show_list:
+        # Split the shown properties into additional properties and resource
+        # properties once, instead of for each resource. The additional
+        # properties are shown first.
+        addition_names = [name for name in show_list
+                          if additions and name in additions]
+        query_names = [name for name in show_list
+                       if not additions or name not in additions]
     for resource in resources:
         resource_props = {}
         if show_list:
-            props_to_query = []
-            for name in show_list:
-                if additions and name in additions:
-                    resource_props[name] = additions[name][resource.uri]
-                    prop_names[name] = None
-                else:
-                    props_to_query.append(name)
-            # Pull selected properties into cache in one call.
+            for name in addition_names:
+                resource_props[name] = additions[name][resource.uri]
+            # Pull selected properties that are not yet cached (e.g. from
+            # the list operation) into cache in one call.
             # Resource.prop() calls pull_full_properties if the value is
             # not cached which is expensive for certain properties.
-            resource.pull_properties(props_to_query)
-            for name in props_to_query:
+            cached_props = resource.properties
+            resource.pull_properties(
+                [name for name in query_names if name not in cached_props])
+            for name in query_names:
                 # May raise zhmcclient exceptions
                 resource_props[name] = resource.prop(name)
-                prop_names[name] = None
+            if not prop_names:
+                prop_names.update(
+                    (name, None) for name in addition_names + query_names)
         else:
             for name in sorted(resource.properties):
                 # May raise zhmcclient exceptions
@@ -1035,17 +1073,23 @@ def print_resources_as_json(
                     prop_names[name] = None
         resource_props_list.append(resource_props)
 
-    json_obj = []
-    for resource_props in resource_props_list:
-        json_res = OrderedDict()
-        for name in sorted(prop_names):
-            value = resource_props.get(name, None)
-            json_res[name] = value
-        json_obj.append(json_res)
-
-    json_str = json.dumps(json_obj)
+    # The JSON array is written one resource at a time, instead of building
+    # the JSON string for all resources in memory. All HMC interactions have
+    # completed at this point, so the output cannot be cut short by errors.
+    # The pieces are written without flushing (which click.echo() would do),
+    # so that stdout buffering combines them into few large writes.
+    sorted_prop_names = sorted(prop_names)
     cmd_ctx.spinner.stop()
-    click.echo(json_str)
+    stdout = sys.stdout
+    stdout.write('[')
+    for index, resource_props in enumerate(resource_props_list):
+        json_res = OrderedDict()
+        for name in sorted_prop_names:
+            json_res[name] = resource_props.get(name, None)
+        if index > 0:
+            stdout.write(', ')
+        stdout.write(json.dumps(json_res))
+    click.echo(']')
 
 
 def print_dicts_as_json(
@@ -1116,6 +1160,48 @@ def print_dicts_as_json(
     click.echo(json_str)
 
 
+def concurrent_map(func, items):
+    """
+    Call a function for each of the items, using up to MAX_PARALLEL_PULLS
+    concurrent threads, and return the results in the order of the items.
+
+    This reduces the elapsed time compared to calling the function for one
+    item after the other, when the time is dominated by the round trips to
+    the HMC. For zero or one items, the function is called in the current
+    thread.
+
+    All threads share the zhmcclient.Session of the items. The automatic
+    re-logon of that session when the HMC rejects a request with HTTP
+    status 403 and reason 4 or 5 (session expired) is not synchronized
+    between threads, so concurrent requests may each log on again, and an
+    operation that failed due to the expired session may be retried. Use
+    this function only for requests where that is acceptable.
+
+    Parameters:
+
+      func (callable): The function to be called. It is called with one
+        item as its only positional argument.
+
+      items (iterable): The items.
+
+    Returns:
+
+      list: The return values of the function calls, in the order of the
+      items.
+
+    Raises:
+        Any exception raised by the function. If the function raises for
+        more than one item, the exception for the first such item is raised.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    max_workers = min(MAX_PARALLEL_PULLS, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consuming the results re-raises any exception in this thread
+        return list(executor.map(func, items))
+
+
 class ExceptionThread(threading.Thread):
     """
     A thread class derived from :class:`py:threading.Thread` that handles
@@ -1384,8 +1470,13 @@ def storage_management_feature(cpc_or_partition):
     On z13 and earlier, the storage managemt feature is always disabled.
     On z14 and later, the storage managemt feature is always enabled.
     Nevertheless, this function performs the proper lookup of the feature.
+
+    If the resource object does not yet have the 'available-features-list'
+    property, only that property is retrieved from the HMC.
     """
-    features = cpc_or_partition.prop('available-features-list', [])
+    if 'available-features-list' not in cpc_or_partition.properties:
+        cpc_or_partition.pull_properties(['available-features-list'])
+    features = cpc_or_partition.properties.get('available-features-list', [])
     for f in features:
         if f['name'] == 'dpm-storage-management':
             return f['state']
@@ -1407,6 +1498,26 @@ def hide_property(properties, prop_name):
         properties[prop_name] = "... (hidden)"
 
 
+class ConstantAdditions:
+    """
+    A mapping that returns the same value for any key.
+
+    This can be used as the per-resource dict in the `additions` parameter of
+    print_resources(), for additional properties that have the same value for
+    all resources (e.g. the name of the parent resource). That avoids building
+    a dict with one item per resource.
+    """
+
+    def __init__(self, value):
+        self._value = value
+
+    def __getitem__(self, key):
+        return self._value
+
+    def __repr__(self):
+        return f"ConstantAdditions({self._value!r})"
+
+
 class ObjectByUriCache:
     """
     Object cache that allows lookup of resource objects by URI.